@@ -1,13 +1,40 @@
+import functools
+import inspect
 import json
+import logging
 import math
+import os
+import threading
 import concurrent.futures
+from collections import namedtuple
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import torch
 from PIL import Image, ImageDraw, ImageFilter
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; ujson / the stdlib parser and a plain formatter are used instead
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # ujson is optional too
+    ujson = None
+
+try:
+    from scipy.ndimage import gaussian_filter1d
+except ImportError:  # scipy is optional; frames are then blurred one by one with PIL
+    gaussian_filter1d = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; frames are then drawn one by one
+    njit = None
+
 # External utilities: keep relative imports as in original file / environment
-from ..utility.utility import pil2tensor, tensor2pil
+from ..utility.utility import tensor2pil
 from ..utility import draw_utils
 from ..utility.driver_utils import apply_driver_offset, rotate_path, smooth_path, interpolate_path
 from .draw_shapes_dr import (
@@ -15,21 +42,188 @@ from .draw_shapes_dr import (
     apply_driver_chain_offsets,
     build_interpolated_paths,
     build_layer_path_map,
-    calculate_driver_offset,
+    calculate_driver_offsets,
     DriverGraphError,
-    get_driver_scale_for_frame,
     normalize_layer_names,
     process_driver_path,
     resolve_driver_processing_order,
     resample_scale_profile,
     round_coord,
     scale_driver_metadata,
+    scale_path_points,
     scale_points_and_driver_path,
 )
 
+log = logging.getLogger(__name__)
+
 Coord = Dict[str, Any]  # expects {'x': float, 'y': float, ...}
 Path = List[Coord]
 
+if orjson is not None:
+    _json_loads = orjson.loads
+elif ujson is not None:
+    _json_loads = ujson.loads
+else:
+    _json_loads = json.loads
+
+# Older Pillow releases lack polygon outline/width; probe once instead of catching TypeError per shape
+_POLYGON_PARAMS = inspect.signature(ImageDraw.ImageDraw.polygon).parameters
+_POLYGON_HAS_OUTLINE = "outline" in _POLYGON_PARAMS
+_POLYGON_HAS_WIDTH = _POLYGON_HAS_OUTLINE and "width" in _POLYGON_PARAMS
+
+# Per-frame view of a driver dict, built once per run so frames don't repeat the dict lookups.
+# offsets is the _driver_offset_table(); box_rotations holds the boxR delta per driver frame (box drivers only).
+_DriverView = namedtuple("_DriverView", (
+    "info", "pos_delay", "neg_lead", "driver_type", "pivot", "pivot_normalized",
+    "box_scale_ratios", "offsets", "box_rotations", "is_points_mode",
+))
+
+# Everything _draw_single_frame_pil reads that is the same for every frame of a run, built once before dispatch.
+# path_positions, path/static_driver_views, static_layer_arrays and points_mode_arrays are the per-run precomputes;
+# path_widths / path_heights are the per-path shape sizes from _path_shape_sizes().
+_FrameContext = namedtuple("_FrameContext", (
+    "frame_buffers", "bg_frame", "bg_template", "processed_coords_list", "total_frames", "frame_width", "frame_height",
+    "shape", "shape_width", "shape_height", "shape_color", "border_width", "border_color", "blur_radius",
+    "path_widths", "path_heights", "layer_visibility", "path_positions", "path_driver_views", "points_mode_arrays",
+    "static_point_layers", "static_points_scale", "static_points_scales_list", "static_points_pause_frames_list",
+    "static_points_offsets_list", "static_points_visibility_list", "static_layer_arrays", "static_driver_views",
+))
+
+
+# Fallbacks for the fields drawshapemask fills in on each animated path's driver dict
+_SANITIZED_DRIVER_DEFAULTS = {
+    'pause_frames': (0, 0),
+    'd_scale': 1.0,
+    'easing_function': 'linear',
+    'easing_path': 'full',
+    'easing_strength': 1.0,
+    'start_pause': 0,
+    'end_pause': 0,
+    'offset': 0,
+    'driver_scale_factor': 1.0,
+    'driver_scale_profile': None,
+    'driver_pivot': None,
+    'driver_type': None,
+    'driver_path_normalized': True,
+    'driver_layer_name': None,
+}
+
+
+def _path_xy(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a path of {"x", "y"} dicts into a float64 (N, 2) position array, plus an (N,)
+    bool mask of the points that parsed; missing keys read as 0, unparsable points as (0, 0).
+    """
+    xy = np.zeros((len(path), 2), dtype=np.float64)
+    valid = np.ones(len(path), dtype=bool)
+    for k, pt in enumerate(path):
+        try:
+            xy[k] = float(pt.get("x", 0.0)), float(pt.get("y", 0.0))
+        except (TypeError, ValueError, AttributeError):
+            valid[k] = False
+    return xy, valid
+
+
+def _track_to_json(track: np.ndarray) -> str:
+    """Format an int (N, 3) [x, y, v] track array as an ATI JSON list of {"x", "y", "v"} points."""
+    if orjson is not None:
+        return orjson.dumps([{"x": x, "y": y, "v": v} for x, y, v in track.tolist()]).decode()
+    return "[" + ",".join(f'{{"x":{x},"y":{y},"v":{v}}}' for x, y, v in track.tolist()) + "]"
+
+
+def _rotate_points(points: List[Tuple[float, float]], cx: float, cy: float,
+                   angle: float) -> List[Tuple[float, float]]:
+    """Rotate (x, y) points around center (cx, cy) by angle in radians."""
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    return [(cx + (px - cx) * cos_a - (py - cy) * sin_a, cy + (px - cx) * sin_a + (py - cy) * cos_a)
+            for px, py in points]
+
+
+@functools.lru_cache(maxsize=64)
+def _shape_stamp(shape: str, box_width: int, box_height: int, shape_color: str,
+                 border_width: int, border_color: str) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Pre-drawn axis-aligned circle/square whose integer bounding box is box_width x box_height.
+    Returns (rgb, mask, pad): the stamp is padded by `pad` pixels on each side because
+    PIL outlines may spill past the box.
+    """
+    pad = border_width + 1
+    size = (box_width + 1 + 2 * pad, box_height + 1 + 2 * pad)
+    box = [pad, pad, pad + box_width, pad + box_height]
+    rgb = Image.new("RGB", size)
+    mask = Image.new("L", size, 0)
+    for image, fill, outline in ((rgb, shape_color, border_color), (mask, 255, 255)):
+        draw = ImageDraw.Draw(image)
+        draw_fn = draw.ellipse if shape == 'circle' else draw.rectangle
+        if border_width > 0:
+            draw_fn(box, fill=fill, outline=outline, width=border_width)
+        else:
+            draw_fn(box, fill=fill)
+    rgb_array = np.asarray(rgb)
+    mask_array = np.asarray(mask) > 0
+    rgb_array.flags.writeable = False
+    mask_array.flags.writeable = False
+    return rgb_array, mask_array, pad
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _stamp_frames(frames, origins, stamp_ids, stamp_rgb, stamp_mask):
+        """
+        Copy stamp stamp_ids[t, n] into frames[t] with its top-left corner at origins[t, n]
+        (x, y), in path order. Negative ids are skipped. Frames are stamped in parallel.
+        """
+        num_frames, frame_height, frame_width = frames.shape[0], frames.shape[1], frames.shape[2]
+        stamp_height, stamp_width = stamp_mask.shape[1], stamp_mask.shape[2]
+        for t in prange(num_frames):
+            for n in range(stamp_ids.shape[1]):
+                k = stamp_ids[t, n]
+                if k < 0:
+                    continue
+                origin_x = origins[t, n, 0]
+                origin_y = origins[t, n, 1]
+                for row in range(max(0, -origin_y), min(stamp_height, frame_height - origin_y)):
+                    for col in range(max(0, -origin_x), min(stamp_width, frame_width - origin_x)):
+                        if stamp_mask[k, row, col]:
+                            frames[t, origin_y + row, origin_x + col, 0] = stamp_rgb[k, row, col, 0]
+                            frames[t, origin_y + row, origin_x + col, 1] = stamp_rgb[k, row, col, 1]
+                            frames[t, origin_y + row, origin_x + col, 2] = stamp_rgb[k, row, col, 2]
+
+    @njit(parallel=True, cache=True)
+    def _blend_frames(background, frames, alpha):
+        """
+        Alpha-blend frames over background in place and clamp to [0, 1], in one pass:
+        frames = clip(background * (1 - alpha) + frames * alpha). Frames are blended in parallel.
+        """
+        for t in prange(frames.shape[0]):
+            for y in range(frames.shape[1]):
+                for x in range(frames.shape[2]):
+                    for c in range(frames.shape[3]):
+                        bg = background[t, y, x, c]
+                        value = bg + alpha * (frames[t, y, x, c] - bg)
+                        frames[t, y, x, c] = min(max(value, 0.0), 1.0)
+else:
+    _stamp_frames = None
+    _blend_frames = None
+
+
+_FRAME_POOL: Optional[concurrent.futures.ThreadPoolExecutor] = None
+# Frame drawing holds the GIL for most of its Python-level work, so more threads than this only add contention
+_FRAME_POOL_WORKERS = min(os.cpu_count() or 1, 8)
+_FRAME_POOL_LOCK = threading.Lock()
+
+
+def _get_frame_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Shared frame-rendering pool, created on first use and reused across node runs."""
+    global _FRAME_POOL
+    if _FRAME_POOL is None:
+        with _FRAME_POOL_LOCK:
+            if _FRAME_POOL is None:
+                _FRAME_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=_FRAME_POOL_WORKERS)
+    return _FRAME_POOL
+
+
 # Constants
 DEFAULT_FRAME_WIDTH = 512
 DEFAULT_FRAME_HEIGHT = 512
@@ -39,6 +233,9 @@ PREVIEW_SCALE_FACTOR = 0.5
 DRIVER_SCALE_FACTOR = 1.0
 TRAILING_WEIGHT_FACTOR = 0.5
 ALPHA_BLEND_FACTOR = 0.5
+PREVIEW_GPU_MIN_FRAMES = 16  # below this the host->device copy costs more than it saves
+PARALLEL_FRAME_THRESHOLD = 8  # shorter batches render serially; pool dispatch would cost more than it saves
+STAMP_BATCH_MAX_PIXELS = 1 << 24  # cap on the packed stamp array used by _stamp_path_frames
 MIN_SHAPE_SIZE = 2
 MAX_SHAPE_SIZE = 1000
 MIN_BLUR_RADIUS = 0.0
@@ -89,7 +286,7 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                 "frames": ("INT", {"forceInput": True},{"default": 121 }),
                 "animated_fade_start": ("FLOAT", {"default": 1.0, "min": 0.0, "max": 1.0, "step": 0.01}),
                 "static_fade_start": ("FLOAT", {"default": 1.0, "min": 0.0, "max": 1.0, "step": 0.01}),
-                "preview_enabled": ("BOOLEAN", {"default": True}),
+                "preview_enabled": ("BOOLEAN", {"default": True, "tooltip": "Build the half-size preview of the shapes over bg_image. When disabled, a 1x1 placeholder is returned and the preview resize and blend are skipped."}),
             }
         }
 
@@ -136,16 +333,6 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
         Draw a single shape at the specified location with optional rotation.
         This consolidates the repeated shape drawing logic.
         """
-        def rotate_point(px, py, cx, cy, angle):
-            """Rotate point (px,py) around center (cx,cy) by angle in radians"""
-            if abs(angle) < 1e-6:
-                return px, py
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
-            dx = px - cx
-            dy = py - cy
-            return (cx + dx * cos_a - dy * sin_a, cy + dx * sin_a + dy * cos_a)
-
         if shape in ('circle', 'square'):
             # Define corners
             left_up_point = (location_x - shape_width / 2.0, location_y - shape_height / 2.0)
@@ -164,12 +351,9 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                     left_down = (location_x - shape_width / 2.0, location_y + shape_height / 2.0)
                     right_up = (location_x + shape_width / 2.0, location_y - shape_height / 2.0)
                     corners = [left_up_point, right_up, right_down_point, left_down]
-                    rotated_corners = [rotate_point(px, py, location_x, location_y, rotation_radians) for px, py in corners]
-                    if border_width > 0:
-                        try:
-                            draw.polygon(rotated_corners, fill=shape_color, outline=border_color, width=border_width)
-                        except TypeError:
-                            draw.polygon(rotated_corners, fill=shape_color)
+                    rotated_corners = _rotate_points(corners, location_x, location_y, rotation_radians)
+                    if border_width > 0 and _POLYGON_HAS_WIDTH:
+                        draw.polygon(rotated_corners, fill=shape_color, outline=border_color, width=border_width)
                     else:
                         draw.polygon(rotated_corners, fill=shape_color)
                 else:
@@ -188,141 +372,402 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
 
             # Apply rotation if specified
             if abs(rotation_radians) > 1e-6:
-                poly_points = [rotate_point(px, py, location_x, location_y, rotation_radians) for px, py in poly_points]
+                poly_points = _rotate_points(poly_points, location_x, location_y, rotation_radians)
 
-            if border_width > 0:
-                try:
-                    draw.polygon(poly_points, fill=shape_color, outline=border_color)
-                except TypeError:
-                    draw.polygon(poly_points, fill=shape_color)
+            if border_width > 0 and _POLYGON_HAS_OUTLINE:
+                draw.polygon(poly_points, fill=shape_color, outline=border_color)
             else:
                 draw.polygon(poly_points, fill=shape_color)
 
-    def _draw_single_frame_pil(self, frame_index: int, processed_coords_list: List[Path],
-                               path_pause_frames: List[Tuple[int, int]], total_frames: int,
-                               frame_width: int, frame_height: int,
-                               shape_width: int, shape_height: int,
-                               shape_color: str, bg_color: str,
-                               blur_radius: float, shape: str,
-                               border_width: int, border_color: str,
-                               static_point_layers: Optional[List[List[Coord]]] = None,
-                               static_points_use_driver: bool = False,
-                               static_points_driver_path: Optional[Path] = None,
-                               static_points_pause_frames_list: Optional[List[Tuple[int, int]]] = None,
-                               coords_driver_info_list: Optional[List[Optional[Dict[str, Any]]]] = None,
-                               scales_list: Optional[List[float]] = None,
-                               static_points_scale: float = 1.0,
-                               static_points_scales_list: Optional[List[float]] = None,
-                               static_points_driver_info_list: Optional[List[Optional[Dict[str, Any]]]] = None,
-                               static_points_interpolated_drivers: Optional[List[Dict[str, Any]]] = None,
-                               resolved_driver_paths: Optional[Dict[str, List[Dict[str, float]]]] = None,
-                               layer_visibility: Optional[List[bool]] = None,
-                               static_points_offsets_list: Optional[List[int]] = None,
-                               static_points_visibility_list: Optional[List[bool]] = None) -> Image.Image:
+    def _static_layer_arrays(self, static_point_layers: Optional[List[List[Coord]]]
+                             ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
         """
-        Draw one frame using PIL.
-        This function is thread-safe and used by ThreadPoolExecutor in drawshapemask.
-        Returns a PIL RGB image.
+        Per static layer: (N, 2) base positions plus (N,) pointScale and boxScale factors.
+        Points with unusable coordinates are dropped, as the per-frame drawing used to do.
+        """
+        layer_arrays = []
+        for static_points in static_point_layers or []:
+            base_xy, point_scales, box_scales = [], [], []
+            for point in static_points or []:
+                try:
+                    base_xy.append((float(point['x']), float(point['y'])))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                try:
+                    point_scales.append(float(point.get('pointScale', point.get('scale', 1.0))))
+                except (TypeError, ValueError):
+                    point_scales.append(1.0)
+                try:
+                    box_scales.append(float(point.get('boxScale', 1.0)))
+                except (TypeError, ValueError):
+                    box_scales.append(1.0)
+            layer_arrays.append((
+                np.array(base_xy, dtype=np.float64).reshape(-1, 2),
+                np.array(point_scales, dtype=np.float64),
+                np.array(box_scales, dtype=np.float64),
+            ))
+        return layer_arrays
 
-        Coordinate System:
-        - All coordinates are expected in pixel coordinates relative to frame dimensions
-        - Static points (p_coordinates) represent fixed positions that can be driven by driver paths
-        - Animated paths contain sequences of coordinates representing motion over time
-        - Driver paths are in normalized coordinates (0-1) and get scaled to frame dimensions
+    def _points_mode_arrays(self, processed_coords_list: List[Path],
+                            path_driver_views: List[Optional[_DriverView]]) -> List[Optional[np.ndarray]]:
         """
-        image = Image.new("RGB", (frame_width, frame_height), bg_color)
-        draw = ImageDraw.Draw(image)
-        current_width = float(shape_width)
-        current_height = float(shape_height)
-        
-        # Apply scale to shape dimensions if scales_list is provided
-        if scales_list and len(scales_list) > 0:
-            # Use the first scale value for static points (if any)
-            scale = float(scales_list[0])
-            current_width *= scale
-            current_height *= scale
+        Per path: (N, 2) positions of a driven points-mode layer, or None for other paths.
+        Points without numeric coordinates are dropped, as the per-frame drawing used to do.
+        """
+        layer_arrays: List[Optional[np.ndarray]] = [None] * len(processed_coords_list)
+        for path_idx, coords in enumerate(processed_coords_list):
+            view = path_driver_views[path_idx]
+            if view is None or not view.is_points_mode or not isinstance(coords, list):
+                continue
+            points_xy = []
+            for point in coords:
+                try:
+                    points_xy.append((point['x'] + 0.0, point['y'] + 0.0))
+                except (KeyError, TypeError):
+                    continue
+            layer_arrays[path_idx] = np.array(points_xy, dtype=np.float64).reshape(-1, 2)
+        return layer_arrays
 
-        driver_cache: Dict[str, Dict[str, Any]] = {}
+    def _driver_offset_table(self, driver_info: Dict[str, Any], frame_width: int, frame_height: int) -> np.ndarray:
+        """
+        Driver offset for every effective driver frame, as a (len(driver_path), 2) array.
+        Frames past the end of the driver path reuse its last row. A driver without a
+        path gives a single zero row.
+        """
+        path_key = driver_info.get('driver_path_key', 'interpolated_path')
+        driver_path = driver_info.get(path_key)
+        if not isinstance(driver_path, list) or len(driver_path) == 0:
+            return np.zeros((1, 2), dtype=np.float64)
+
+        driver_scale_factor = driver_info.get('driver_scale_factor', 1.0)
+        driver_radius_delta = driver_info.get('driver_radius_delta', 0.0)
+        apply_scale_to_offset = driver_info.get('apply_scale_to_offset', None)
+        if apply_scale_to_offset is None:
+            apply_scale_to_offset = driver_info.get('driver_type') != 'box'
+
+        # For box drivers, keep the offset purely translational in terms of
+        # box radius/scale, but still allow d_scale (D_scale) to scale how
+        # much of the box motion is applied to driven layers.
+        if driver_info.get('driver_type') == 'box':
+            driver_scale_factor = 1.0  # ignore box scale for offsets
+            driver_radius_delta = 0.0  # no radial push from box radius
+            apply_scale_to_offset = True  # ensure d_scale affects offset
+
+        offsets = calculate_driver_offsets(
+            range(len(driver_path)), driver_path, driver_info.get('d_scale', 1.0),
+            frame_width, frame_height, driver_scale_factor=driver_scale_factor,
+            driver_radius_delta=driver_radius_delta,
+            driver_path_normalized=driver_info.get('driver_path_normalized', False),
+            apply_scale_to_offset=apply_scale_to_offset
+        )
 
-        def _register_driver_info(info: Optional[Dict[str, Any]]):
-            if isinstance(info, dict):
-                name = info.get('layer_name')
-                if name:
-                    driver_cache[name] = info
+        rotate_degrees = driver_info.get('rotate', 0.0)
+        if rotate_degrees and rotate_degrees != 0.0:
+            try:
+                angle_rad = math.radians(float(rotate_degrees))
+            except (TypeError, ValueError):
+                return offsets
+            cos_a = math.cos(angle_rad)
+            sin_a = math.sin(angle_rad)
+            offsets = offsets @ np.array([[cos_a, sin_a], [-sin_a, cos_a]])
+        return offsets
+
+    def _box_rotation_table(self, box_path: Path) -> List[float]:
+        """Rotation (radians) of each box driver frame relative to the first; unparsable entries give 0."""
+        try:
+            base_rot = float(box_path[0].get("boxR", 0.0) or 0.0)
+        except (TypeError, ValueError, AttributeError):
+            return [0.0] * len(box_path)
+        rotations = []
+        for point in box_path:
+            try:
+                rotations.append(float(point.get("boxR", 0.0) or 0.0) - base_rot)
+            except (TypeError, ValueError, AttributeError):
+                rotations.append(0.0)
+        return rotations
 
-        if coords_driver_info_list:
-            for info in coords_driver_info_list:
-                _register_driver_info(info)
-        if static_points_interpolated_drivers:
-            for info in static_points_interpolated_drivers:
-                _register_driver_info(info)
-
-        def _get_effective_frame(driver_info: Dict[str, Any], base_frame_index: int) -> int:
-            start_pause = int(driver_info.get('start_pause', 0))
-            offset_val = int(driver_info.get('offset', 0))
-            pos_delay = start_pause + max(0, offset_val)
-            neg_lead = -min(0, offset_val)
-            return max(0, base_frame_index - pos_delay + neg_lead)
-
-        def _compute_single_driver_offset(driver_info: Optional[Dict[str, Any]], base_frame_index: int) -> Tuple[float, float]:
-            if not driver_info or not isinstance(driver_info, dict):
-                return 0.0, 0.0
-            path_key = driver_info.get('driver_path_key', 'interpolated_path')
-            driver_path = driver_info.get(path_key)
-            if not isinstance(driver_path, list) or len(driver_path) == 0:
-                return 0.0, 0.0
-            eff_frame = _get_effective_frame(driver_info, base_frame_index)
-            driver_path_normalized = driver_info.get('driver_path_normalized', False)
-            d_scale = driver_info.get('d_scale', 1.0)
-            driver_scale_factor = driver_info.get('driver_scale_factor', 1.0)
-            driver_radius_delta = driver_info.get('driver_radius_delta', 0.0)
-            apply_scale_to_offset = driver_info.get('apply_scale_to_offset', None)
-            if apply_scale_to_offset is None:
-                apply_scale_to_offset = driver_info.get('driver_type') != 'box'
-
-            # For box drivers, keep the offset purely translational in terms of
-            # box radius/scale, but still allow d_scale (D_scale) to scale how
-            # much of the box motion is applied to driven layers.
-            if driver_info.get('driver_type') == 'box':
-                driver_scale_factor = 1.0  # ignore box scale for offsets
-                driver_radius_delta = 0.0  # no radial push from box radius
-                apply_scale_to_offset = True  # ensure d_scale affects offset
-
-            offset_x, offset_y = calculate_driver_offset(
-                eff_frame, driver_path, (0, 0), total_frames, d_scale,
-                frame_width, frame_height, driver_scale_factor=driver_scale_factor,
-                driver_radius_delta=driver_radius_delta,
-                driver_path_normalized=driver_path_normalized,
-                apply_scale_to_offset=apply_scale_to_offset
-            )
+    def _box_scale_ratio_table(self, scale_profile: List[float]) -> np.ndarray:
+        """Scale of each box driver frame relative to the first; unparsable entries give 1."""
+        try:
+            base_scale = float(scale_profile[0]) or 1.0
+        except (TypeError, ValueError):
+            base_scale = 1.0
+        ratios = np.empty(len(scale_profile), dtype=np.float64)
+        for k, value in enumerate(scale_profile):
+            try:
+                ratios[k] = float(value)
+            except (TypeError, ValueError):
+                ratios[k] = base_scale
+        ratios /= base_scale
+        return ratios
+
+    def _driver_view(self, driver_info: Dict[str, Any], frame_width: int, frame_height: int) -> _DriverView:
+        start_pause = int(driver_info.get('start_pause', 0))
+        offset_val = int(driver_info.get('offset', 0))
+        driver_type = driver_info.get('driver_type')
+        box_rotations = None
+        box_scale_ratios = None
+        if driver_type == 'box':
+            box_path = driver_info.get('interpolated_path') or driver_info.get('path')
+            if box_path:
+                box_rotations = self._box_rotation_table(box_path)
+            scale_profile = driver_info.get('driver_scale_profile')
+            if scale_profile:
+                box_scale_ratios = self._box_scale_ratio_table(scale_profile)
+        return _DriverView(
+            info=driver_info,
+            pos_delay=start_pause + max(0, offset_val),
+            neg_lead=-min(0, offset_val),
+            driver_type=driver_type,
+            pivot=driver_info.get('driver_pivot'),
+            pivot_normalized=driver_info.get('driver_path_normalized', True),
+            box_scale_ratios=box_scale_ratios,
+            offsets=self._driver_offset_table(driver_info, frame_width, frame_height),
+            box_rotations=box_rotations,
+            is_points_mode=bool(driver_info.get('is_points_mode', False)),
+        )
 
-            rotate_degrees = driver_info.get('rotate', 0.0)
-            if rotate_degrees and rotate_degrees != 0.0:
-                try:
-                    angle_rad = math.radians(float(rotate_degrees))
-                    cos_a = math.cos(angle_rad)
-                    sin_a = math.sin(angle_rad)
-                    rx = offset_x * cos_a - offset_y * sin_a
-                    ry = offset_x * sin_a + offset_y * cos_a
-                    offset_x, offset_y = rx, ry
-                except Exception:
-                    pass
+    def _build_driver_views(self, driver_infos: List[Optional[Dict[str, Any]]],
+                            frame_width: int, frame_height: int) -> Dict[int, _DriverView]:
+        """Driver views for each distinct driver dict, keyed by id() since the same dicts are passed to every frame."""
+        views: Dict[int, _DriverView] = {}
+        for info in driver_infos:
+            if isinstance(info, dict) and id(info) not in views:
+                views[id(info)] = self._driver_view(info, frame_width, frame_height)
+        return views
+
+    def _lookup_driver_view(self, driver_views: Dict[int, _DriverView], driver_info: Any,
+                            frame_width: int, frame_height: int) -> Optional[_DriverView]:
+        """View for a driver entry, or None if the entry is not a usable driver dict."""
+        if not driver_info or not isinstance(driver_info, dict):
+            return None
+        view = driver_views.get(id(driver_info))
+        return view if view is not None else self._driver_view(driver_info, frame_width, frame_height)
+
+    def _path_driver_views(self, num_paths: int, coords_driver_info_list: Optional[List[Optional[Dict[str, Any]]]],
+                           driver_views: Dict[int, _DriverView], frame_width: int, frame_height: int
+                           ) -> List[Optional[_DriverView]]:
+        """Driver view (or None) for each animated path."""
+        views: List[Optional[_DriverView]] = [None] * num_paths
+        for path_idx, info in enumerate((coords_driver_info_list or [])[:num_paths]):
+            views[path_idx] = self._lookup_driver_view(driver_views, info, frame_width, frame_height)
+        return views
+
+    def _static_layer_driver_views(self, num_layers: int, static_points_use_driver: bool,
+                                   static_points_interpolated_drivers: Optional[List[Dict[str, Any]]],
+                                   driver_views: Dict[int, _DriverView], frame_width: int, frame_height: int
+                                   ) -> List[Optional[_DriverView]]:
+        """
+        Driver view (or None) for each static point layer. Layers without their own
+        entry fall back to the first driver unless the driver list is aligned with the layers.
+        """
+        views: List[Optional[_DriverView]] = [None] * num_layers
+        if not static_points_use_driver or not static_points_interpolated_drivers:
+            return views
+        aligned_static_drivers = len(static_points_interpolated_drivers) == num_layers
+        first_static_driver = None
+        for entry in static_points_interpolated_drivers:
+            if isinstance(entry, dict):
+                first_static_driver = entry
+                break
+        for layer_idx in range(num_layers):
+            layer_driver_info = None
+            if layer_idx < len(static_points_interpolated_drivers):
+                layer_driver_info = static_points_interpolated_drivers[layer_idx]
+            if layer_driver_info is None and not aligned_static_drivers:
+                layer_driver_info = first_static_driver
+            views[layer_idx] = self._lookup_driver_view(driver_views, layer_driver_info, frame_width, frame_height)
+        return views
+
+    def _driver_frame_state(self, view: _DriverView, base_frame_index: int) -> Tuple[int, float, float, float]:
+        """(effective driver frame, offset x, offset y, box rotation) of a driver at base_frame_index."""
+        eff_frame = max(0, base_frame_index - view.pos_delay + view.neg_lead)
+        offset_x, offset_y = view.offsets[min(eff_frame, len(view.offsets) - 1)]
+        rotation_rad = 0.0
+        if view.box_rotations:
+            rotation_rad = view.box_rotations[min(eff_frame, len(view.box_rotations) - 1)]
+        return eff_frame, float(offset_x), float(offset_y), rotation_rad
+
+    def _driver_offsets_for_frames(self, view: _DriverView, frame_indices: np.ndarray) -> np.ndarray:
+        """Driver offsets for a whole range of base frames at once, as a (len(frame_indices), 2) array."""
+        eff_frames = np.clip(frame_indices - view.pos_delay + view.neg_lead, 0, len(view.offsets) - 1)
+        return view.offsets[eff_frames]
+
+    def _resolve_path_positions(self, processed_coords_list: List[Path],
+                                path_pause_frames: List[Tuple[int, int]], total_frames: int,
+                                frame_width: int, frame_height: int,
+                                coords_driver_info_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+                                driver_views: Optional[Dict[int, _DriverView]] = None) -> np.ndarray:
+        """
+        Resolve where every regular animated path is drawn on every frame.
+        Returns a (num_paths, total_frames, 2) array with start/end pauses and driver
+        offsets folded in. Entries are NaN where nothing is drawn: empty paths,
+        points-mode layers with a driver (drawn per frame), and frames past the path end.
+        """
+        frames = np.arange(total_frames)
+        positions = np.full((len(processed_coords_list), total_frames, 2), np.nan)
+        for path_idx, coords in enumerate(processed_coords_list):
+            if not isinstance(coords, list) or len(coords) == 0:
+                continue
+            driver_info = None
+            if coords_driver_info_list and path_idx < len(coords_driver_info_list):
+                driver_info = coords_driver_info_list[path_idx]
+            if driver_info and driver_info.get('is_points_mode', False):
+                continue
+            try:
+                coords_xy = np.array([(pt['x'], pt['y']) for pt in coords], dtype=np.float64)
+            except (KeyError, TypeError, ValueError):
+                continue
 
-            return offset_x, offset_y
+            # Hold the first coordinate during the start pause and the last one during the end pause
+            path_start_p, path_end_p = path_pause_frames[path_idx]
+            path_animation_frames = max(1, total_frames - path_start_p - path_end_p)
+            coord_index = np.where(frames >= total_frames - path_end_p, path_animation_frames - 1, frames - path_start_p)
+            coord_index = np.where(frames < path_start_p, 0, coord_index)
+            drawn = (coord_index >= 0) & (coord_index < len(coords_xy))
+            positions[path_idx, drawn] = coords_xy[coord_index[drawn]]
+
+            if driver_info:
+                view = driver_views.get(id(driver_info)) if driver_views else None
+                if view is None:
+                    view = self._driver_view(driver_info, frame_width, frame_height)
+                positions[path_idx] += self._driver_offsets_for_frames(view, frames)
+        return positions
+
+    def _blit_shape_at_location(self, frame_buffer: np.ndarray, location_x: float, location_y: float,
+                                shape: str, shape_width: float, shape_height: float,
+                                shape_color: str, border_width: int, border_color: str,
+                                rotation_radians: float = 0.0) -> bool:
+        """
+        Copy a cached _shape_stamp into frame_buffer instead of drawing the shape with PIL.
+        Output is pixel-identical to _draw_shape_at_location: PIL truncates the box corners
+        to ints and rasterises the same way at any integer offset. Returns False (nothing
+        drawn) for triangles, rotated squares, squares with a border (PIL's thick rectangle
+        outlines depend on the float corners) and boxes under one pixel.
+        """
+        if shape == 'square':
+            if border_width > 0 or abs(rotation_radians) > 1e-6:
+                return False
+        elif shape != 'circle':
+            return False
+
+        x0 = int(location_x - shape_width / 2.0)
+        y0 = int(location_y - shape_height / 2.0)
+        x1 = int(location_x + shape_width / 2.0)
+        y1 = int(location_y + shape_height / 2.0)
+        if x1 <= x0 or y1 <= y0:
+            return False
+
+        rgb, mask, pad = _shape_stamp(shape, x1 - x0, y1 - y0, shape_color, border_width, border_color)
+        origin_x = x0 - pad
+        origin_y = y0 - pad
+        frame_height, frame_width = frame_buffer.shape[:2]
+        left = max(origin_x, 0)
+        top = max(origin_y, 0)
+        right = min(origin_x + mask.shape[1], frame_width)
+        bottom = min(origin_y + mask.shape[0], frame_height)
+        if left >= right or top >= bottom:
+            return True  # entirely off-frame
+
+        stamp_rows = slice(top - origin_y, bottom - origin_y)
+        stamp_cols = slice(left - origin_x, right - origin_x)
+        region = frame_buffer[top:bottom, left:right, :3]
+        region_mask = mask[stamp_rows, stamp_cols]
+        region[region_mask] = rgb[stamp_rows, stamp_cols][region_mask]
+        return True
+
+    def _path_shape_sizes(self, num_paths: int, shape_width: float, shape_height: float,
+                          scales_list: Optional[List[float]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-path shape (widths, heights), scaled by scales_list where it has an entry for the path."""
+        path_scales = np.ones(num_paths, dtype=np.float64)
+        if scales_list:
+            scaled_count = min(len(scales_list), num_paths)
+            path_scales[:scaled_count] = [float(scale) for scale in scales_list[:scaled_count]]
+        return float(shape_width) * path_scales, float(shape_height) * path_scales
+
+    def _stamp_path_frames(self, frame_buffers: np.ndarray, bg_frame: np.ndarray,
+                           path_positions: np.ndarray, path_widths: np.ndarray, path_heights: np.ndarray,
+                           path_visible: np.ndarray, shape: str, shape_color: str,
+                           border_width: int, border_color: str) -> bool:
+        """
+        Render a whole batch of regular animated paths with the numba _stamp_frames kernel.
+        Uses the same _shape_stamp masks as _blit_shape_at_location, so the frames are
+        pixel-identical to drawing them one by one. Returns False (nothing drawn) when numba
+        is missing or some shape can't be stamped; the caller then renders per frame.
+        """
+        if _stamp_frames is None or shape not in ('circle', 'square'):
+            return False
+        if shape == 'square' and border_width > 0:
+            return False
+
+        half_widths = (path_widths / 2.0)[:, None]
+        half_heights = (path_heights / 2.0)[:, None]
+        location_x = path_positions[..., 0]
+        location_y = path_positions[..., 1]
+        drawn = ~np.isnan(location_x) & path_visible[:, None]
+        with np.errstate(invalid="ignore"):
+            x0 = np.trunc(location_x - half_widths)
+            y0 = np.trunc(location_y - half_heights)
+            box_sizes = np.stack((np.trunc(location_x + half_widths) - x0,
+                                  np.trunc(location_y + half_heights) - y0), axis=-1)
+        box_sizes = box_sizes[drawn].astype(np.int64)
+        if box_sizes.size and box_sizes.min() < 1:
+            return False  # sub-pixel boxes go through PIL
+
+        unique_sizes, stamp_index = np.unique(box_sizes.reshape(-1, 2), axis=0, return_inverse=True)
+        stamps = [_shape_stamp(shape, int(box_w), int(box_h), shape_color, border_width, border_color)
+                  for box_w, box_h in unique_sizes.tolist()]
+        stamp_height = max((mask.shape[0] for _, mask, _ in stamps), default=1)
+        stamp_width = max((mask.shape[1] for _, mask, _ in stamps), default=1)
+        if len(stamps) * stamp_height * stamp_width > STAMP_BATCH_MAX_PIXELS:
+            return False
+
+        stamp_rgb = np.zeros((max(len(stamps), 1), stamp_height, stamp_width, 3), dtype=np.uint8)
+        stamp_mask = np.zeros((max(len(stamps), 1), stamp_height, stamp_width), dtype=np.bool_)
+        for k, (rgb, mask, _) in enumerate(stamps):
+            stamp_rgb[k, :rgb.shape[0], :rgb.shape[1]] = rgb
+            stamp_mask[k, :mask.shape[0], :mask.shape[1]] = mask
+
+        pad = border_width + 1
+        stamp_ids = np.full(drawn.shape, -1, dtype=np.int64)
+        stamp_ids[drawn] = stamp_index.reshape(-1)
+        origins = np.zeros(drawn.shape + (2,), dtype=np.int64)
+        origins[drawn, 0] = x0[drawn].astype(np.int64) - pad
+        origins[drawn, 1] = y0[drawn].astype(np.int64) - pad
+
+        frame_buffers[:] = bg_frame
+        # Paths are (N, T); the kernel walks frames first
+        _stamp_frames(frame_buffers, np.ascontiguousarray(origins.transpose(1, 0, 2)),
+                      np.ascontiguousarray(stamp_ids.T), stamp_rgb, stamp_mask)
+        return True
+
+    def _draw_frame_chunk(self, ctx: _FrameContext, frame_indices: List[int]) -> None:
+        """Draw a run of frames serially; one pool task per chunk instead of per frame."""
+        for frame_index in frame_indices:
+            self._draw_single_frame_pil(ctx, frame_index)
+
+    def _draw_single_frame_pil(self, ctx: _FrameContext, frame_index: int) -> None:
+        """
+        Draw one frame into its slot of ctx.frame_buffers.
+        This function is thread-safe and used by ThreadPoolExecutor in drawshapemask.
 
-        def _accumulate_driver_offsets(driver_info: Optional[Dict[str, Any]], base_frame_index: int) -> Tuple[float, float]:
-            if not driver_info:
-                return 0.0, 0.0
-            return _compute_single_driver_offset(driver_info, base_frame_index)
+        Coordinate System:
+        - All coordinates are expected in pixel coordinates relative to frame dimensions
+        - Static points (p_coordinates) represent fixed positions that can be driven by driver paths
+        - Animated paths contain sequences of coordinates representing motion over time
+        - Driver paths are in normalized coordinates (0-1) and get scaled to frame dimensions
 
-        total_static_layers = len(static_point_layers) if static_point_layers else 0
-        aligned_static_drivers = bool(static_points_interpolated_drivers) and len(static_points_interpolated_drivers) == total_static_layers
-        first_static_driver = None
-        if static_points_interpolated_drivers:
-            for entry in static_points_interpolated_drivers:
-                if isinstance(entry, dict):
-                    first_static_driver = entry
-                    break
+        ctx is the per-run _FrameContext. Shapes are blitted straight into the slot when
+        they all have a _shape_stamp; otherwise the frame is drawn with PIL on a copy of
+        ctx.bg_template and copied into the slot.
+        """
+        (frame_buffers, bg_frame, bg_template, processed_coords_list, total_frames, frame_width, frame_height,
+         shape, shape_width, shape_height, shape_color, border_width, border_color, blur_radius,
+         path_widths, path_heights, layer_visibility, path_positions, path_driver_views, points_mode_arrays,
+         static_point_layers, static_points_scale, static_points_scales_list, static_points_pause_frames_list,
+         static_points_offsets_list, static_points_visibility_list, static_layer_arrays, static_driver_views) = ctx
+        # (x, y, width, height, rotation) of every shape on this frame, in drawing order
+        placements: List[Tuple[float, float, float, float, float]] = []
 
         # Draw static points (p_coordinates), optionally driven by static_points_driver_path
         # Static points are individual points that stay in one location but can be moved by driver paths
@@ -345,14 +790,6 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                 static_width = float(shape_width) * layer_scale
                 static_height = float(shape_height) * layer_scale
 
-                # Get the driver for this layer if available
-                layer_driver_info = None
-                if static_points_use_driver and static_points_interpolated_drivers:
-                    if layer_idx < len(static_points_interpolated_drivers):
-                        layer_driver_info = static_points_interpolated_drivers[layer_idx]
-                    if layer_driver_info is None and not aligned_static_drivers:
-                        layer_driver_info = first_static_driver
-
                 # Get this layer's specific timing
                 layer_start_pause = static_points_pause_frames_list[layer_idx][0] if static_points_pause_frames_list and layer_idx < len(static_points_pause_frames_list) else 0
                 layer_end_pause = static_points_pause_frames_list[layer_idx][1] if static_points_pause_frames_list and layer_idx < len(static_points_pause_frames_list) else 0
@@ -373,104 +810,53 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                 driver_frame_index = 0
                 driver_type = None
                 driver_pivot = None
-                driver_scale_profile = None
+                box_scale_ratios = None
                 rotation_rad = 0.0
 
-                if layer_driver_info and isinstance(layer_driver_info, dict):
-                    driver_offset_x, driver_offset_y = _accumulate_driver_offsets(layer_driver_info, driver_eval_frame)
-                    driver_frame_index = _get_effective_frame(layer_driver_info, driver_eval_frame)
-                    driver_type = layer_driver_info.get('driver_type')
-                    driver_pivot = layer_driver_info.get('driver_pivot')
-                    driver_scale_profile = layer_driver_info.get('driver_scale_profile')
-
-                    # Extract rotation from box driver if present
-                    if driver_type == 'box':
-                        driver_path = layer_driver_info.get('interpolated_path') or layer_driver_info.get('path')
-                        if driver_path and len(driver_path) > 0:
-                            try:
-                                eff_idx = min(driver_frame_index, len(driver_path) - 1)
-                                base_rot = float(driver_path[0].get("boxR", 0.0) or 0.0)
-                                cur_rot = float(driver_path[eff_idx].get("boxR", 0.0) or 0.0)
-                                rotation_rad = cur_rot - base_rot
-                            except (TypeError, ValueError, IndexError):
-                                rotation_rad = 0.0
-
-                # First pass: calculate all transformed positions (offset + scale)
-                transformed_positions = []
-                for point in static_points:
-                    try:
-                        base_x = float(point['x'])
-                        base_y = float(point['y'])
-                    except (KeyError, TypeError, ValueError):
-                        continue
-
-                    # Per-point scaling factors
-                    try:
-                        point_scale = float(point.get('pointScale', point.get('scale', 1.0)))
-                    except (TypeError, ValueError):
-                        point_scale = 1.0
-                    try:
-                        box_scale_factor = float(point.get('boxScale', 1.0))
-                    except (TypeError, ValueError):
-                        box_scale_factor = 1.0
-
-                    # Default: no positional scaling, just translation
-                    scaled_x = base_x
-                    scaled_y = base_y
-
-                    # Apply independent scale-out when driven by a box
-                    if driver_type == 'box' and driver_pivot is not None and driver_scale_profile:
-                        pivot_x, pivot_y = driver_pivot
-                        pivot_normalized = layer_driver_info.get('driver_path_normalized', True)
-                        if pivot_normalized:
-                            pivot_x *= frame_width
-                            pivot_y *= frame_height
-
-                        boxScale0 = 1.0
-                        try:
-                            if len(driver_scale_profile) > 0:
-                                boxScale0 = float(driver_scale_profile[0]) or 1.0
-                        except (TypeError, ValueError):
-                            boxScale0 = 1.0
-
-                        try:
-                            if driver_frame_index < len(driver_scale_profile):
-                                boxScale_f = float(driver_scale_profile[driver_frame_index])
-                            else:
-                                boxScale_f = float(driver_scale_profile[-1])
-                        except (TypeError, ValueError):
-                            boxScale_f = boxScale0
-
-                        if boxScale0 != 0.0:
-                            R_box = boxScale_f / boxScale0
-                        else:
-                            R_box = 1.0
-
-                        # Per-point relative scale
-                        R_point = 1.0 + (R_box - 1.0) * point_scale * box_scale_factor
-
-                        dx0 = base_x - pivot_x
-                        dy0 = base_y - pivot_y
-                        scaled_x = pivot_x + dx0 * R_point
-                        scaled_y = pivot_y + dy0 * R_point
-
-                    # Apply pure translation from the driver
-                    location_x = scaled_x + driver_offset_x
-                    location_y = scaled_y + driver_offset_y
-                    transformed_positions.append((location_x, location_y))
+                # Get the driver for this layer if available
+                layer_view = static_driver_views[layer_idx]
+                if layer_view is not None:
+                    driver_frame_index, driver_offset_x, driver_offset_y, rotation_rad = \
+                        self._driver_frame_state(layer_view, driver_eval_frame)
+                    driver_type = layer_view.driver_type
+                    driver_pivot = layer_view.pivot
+                    box_scale_ratios = layer_view.box_scale_ratios
+
+                # First pass: calculate all transformed positions (offset + scale) for the whole layer
+                base_xy, point_scales, box_scales = static_layer_arrays[layer_idx]
+                layer_xy = base_xy
+
+                # Apply independent scale-out when driven by a box
+                if driver_type == 'box' and driver_pivot is not None and box_scale_ratios is not None:
+                    pivot_x, pivot_y = driver_pivot
+                    if layer_view.pivot_normalized:
+                        pivot_x *= frame_width
+                        pivot_y *= frame_height
+
+                    R_box = box_scale_ratios[min(driver_frame_index, len(box_scale_ratios) - 1)]
+
+                    # Per-point relative scale
+                    R_point = 1.0 + (R_box - 1.0) * point_scales * box_scales
+                    pivot = np.array([pivot_x, pivot_y], dtype=np.float64)
+                    layer_xy = pivot + (base_xy - pivot) * R_point[:, None]
+
+                # Apply pure translation from the driver
+                transformed_positions = (layer_xy + (driver_offset_x, driver_offset_y)).tolist()
 
                 # Second pass: rotate all positions around their collective bounding box
                 rotated_positions = self._rotate_positions_around_bbox(transformed_positions, rotation_rad)
 
                 # Third pass: draw each shape at the final rotated position
                 for (location_x, location_y) in rotated_positions:
-                    self._draw_shape_at_location(draw, location_x, location_y, shape,
-                                               static_width, static_height, shape_color,
-                                               border_width, border_color, rotation_rad)
+                    placements.append((location_x, location_y, static_width, static_height, rotation_rad))
 
         # Draw animated paths
         # Animated paths contain sequences of coordinates that change over time
         # Each path represents the motion of a shape through the frames
+        frame_positions = path_positions[:, frame_index]
+
+        debug_drivers = log.isEnabledFor(logging.DEBUG)
+
         for path_idx, coords in enumerate(processed_coords_list):
             if not isinstance(coords, list) or len(coords) == 0:
                 continue
@@ -482,128 +868,62 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
             # Check if this is a points-type layer with driver info
             # Points mode means the layer contains multiple points that should all be drawn simultaneously
             # rather than a single coordinate that changes over time
-            is_points_mode_with_driver = (
-                coords_driver_info_list and
-                path_idx < len(coords_driver_info_list) and
-                coords_driver_info_list[path_idx] and
-                coords_driver_info_list[path_idx].get('is_points_mode', False)
-            )
+            path_view = path_driver_views[path_idx]
+            if path_view is not None and path_view.is_points_mode:
+                if debug_drivers:
+                    log.debug("[DriverDebug] points branch idx=%s layer=%s target=%s",
+                              path_idx, path_view.info.get('layer_name'), path_view.info.get('driver_layer_name'))
+                _, driver_offset_x, driver_offset_y, rotation_rad = \
+                    self._driver_frame_state(path_view, frame_index)
 
-            if is_points_mode_with_driver:
-                driver_info = coords_driver_info_list[path_idx]
-                driver_offset_x = driver_offset_y = 0.0
-                eff_frame = 0
-                print(f"[DriverDebug] points branch idx={path_idx} layer={driver_info.get('layer_name')} target={driver_info.get('driver_layer_name')}")
-                if driver_info:
-                    driver_offset_x, driver_offset_y = _accumulate_driver_offsets(driver_info, frame_index)
-                    eff_frame = _get_effective_frame(driver_info, frame_index)
-
-                # Apply per-path scale if scales_list is provided
-                path_current_width = float(shape_width)
-                path_current_height = float(shape_height)
-                if scales_list and path_idx < len(scales_list):
-                    scale = float(scales_list[path_idx])
-                    path_current_width *= scale
-                    path_current_height *= scale
-                
-                driver_pivot = driver_info.get('driver_pivot') if driver_info else None
-                driver_scale = (
-                    get_driver_scale_for_frame(driver_info, eff_frame, DRIVER_SCALE_FACTOR)
-                    if driver_info
-                    else 1.0
-                )
-
-                # Extract rotation from box driver if present
-                rotation_rad = 0.0
-                if driver_info and driver_info.get('driver_type') == 'box':
-                    interpolated_driver = driver_info.get('interpolated_path') or driver_info.get('path')
-                    if interpolated_driver and len(interpolated_driver) > 0:
-                        try:
-                            eff_idx = min(eff_frame, len(interpolated_driver) - 1)
-                            base_rot = float(interpolated_driver[0].get("boxR", 0.0) or 0.0)
-                            cur_rot = float(interpolated_driver[eff_idx].get("boxR", 0.0) or 0.0)
-                            rotation_rad = cur_rot - base_rot
-                        except (TypeError, ValueError, IndexError):
-                            rotation_rad = 0.0
+                path_current_width = path_widths[path_idx]
+                path_current_height = path_heights[path_idx]
 
                 # First pass: calculate all transformed positions (offset only for points mode)
-                transformed_positions = []
-                for point in coords:
-                    try:
-                        location_x = point['x'] + driver_offset_x
-                        location_y = point['y'] + driver_offset_y
-                        transformed_positions.append((location_x, location_y))
-                    except (KeyError, TypeError):
-                        continue
+                transformed_positions = (points_mode_arrays[path_idx] + (driver_offset_x, driver_offset_y)).tolist()
 
                 # Second pass: rotate all positions around their collective bounding box
                 rotated_positions = self._rotate_positions_around_bbox(transformed_positions, rotation_rad)
 
                 # Third pass: draw each shape at the final rotated position
                 for (location_x, location_y) in rotated_positions:
-                    self._draw_shape_at_location(draw, location_x, location_y, shape,
-                                               path_current_width, path_current_height, shape_color,
-                                               border_width, border_color, rotation_rad)
+                    placements.append((location_x, location_y, path_current_width, path_current_height,
+                                       rotation_rad))
             else:
                 # Regular path drawing (non-points or points without driver)
-                # Determine which coordinate from the path should be used for this frame
-                # This handles pausing at the start and end of path animations
-                path_start_p, path_end_p = path_pause_frames[path_idx]
-                path_animation_frames = max(1, total_frames - path_start_p - path_end_p)
-                if frame_index < path_start_p:
-                    coord_index = 0
-                elif frame_index >= total_frames - path_end_p:
-                    coord_index = path_animation_frames - 1
-                else:
-                    coord_index = frame_index - path_start_p
-
-                if coord_index < 0 or coord_index >= len(coords):
-                    continue
-
-                try:
-                    location_x = coords[coord_index]['x']
-                    location_y = coords[coord_index]['y']
-                except (KeyError, IndexError, TypeError):
+                # Pauses and driver offsets are already folded into path_positions
+                location_x, location_y = frame_positions[path_idx]
+                if math.isnan(location_x):
                     continue
 
-                # Apply driver offset for animated paths if driver info is present
-                driver_offset_x = driver_offset_y = 0.0
-                driver_info = None
-                driver_type = None
-                is_box_driver = False
-                eff_frame3 = 0
-                if coords_driver_info_list and path_idx < len(coords_driver_info_list):
-                    driver_info = coords_driver_info_list[path_idx]
-                    driver_type = driver_info.get('driver_type') if driver_info else None
-                    is_box_driver = driver_type == 'box'
-                    if driver_info and not driver_info.get('is_points_mode', False):
-                        driver_offset_x, driver_offset_y = _accumulate_driver_offsets(driver_info, frame_index)
-                        eff_frame3 = _get_effective_frame(driver_info, frame_index)
-
-                location_x += driver_offset_x
-                location_y += driver_offset_y
-
-                # Apply per-path scale if scales_list is provided
-                path_current_width = float(shape_width)
-                path_current_height = float(shape_height)
-                if scales_list and path_idx < len(scales_list):
-                    scale = float(scales_list[path_idx])
-                    path_current_width *= scale
-                    path_current_height *= scale
-
-                # Driver offsets are now pre-applied to processed_coords_list in drawshapemask
-                # No need to apply them again here
-                # This ensures the driven layer's interpolation is preserved and the driver offset is added on top
+                path_current_width = path_widths[path_idx]
+                path_current_height = path_heights[path_idx]
 
                 # Draw the shape at the computed location using the helper method
+                placements.append((location_x, location_y, path_current_width, path_current_height, 0.0))
+
+        frame_buffer = frame_buffers[frame_index]
+        frame_buffer[:] = bg_frame
+        blitted = all(self._blit_shape_at_location(frame_buffer, location_x, location_y, shape,
+                                                   placed_width, placed_height, shape_color,
+                                                   border_width, border_color, rotation_rad)
+                      for location_x, location_y, placed_width, placed_height, rotation_rad in placements)
+        if blitted and not (blur_radius and blur_radius > 0.0):
+            return
+
+        if blitted:
+            image = Image.fromarray(frame_buffer[..., :3])
+        else:
+            # Some shape has no stamp; draw the whole frame with PIL (stamps are pixel-identical to it)
+            image = bg_template.copy()
+            draw = ImageDraw.Draw(image)
+            for location_x, location_y, placed_width, placed_height, rotation_rad in placements:
                 self._draw_shape_at_location(draw, location_x, location_y, shape,
-                                           path_current_width, path_current_height, shape_color,
-                                           border_width, border_color)
-
+                                             placed_width, placed_height, shape_color,
+                                             border_width, border_color, rotation_rad)
         if blur_radius and blur_radius > 0.0:
             image = image.filter(ImageFilter.GaussianBlur(blur_radius))
-
-        return image
+        frame_buffer[..., :3] = np.asarray(image)
 
     def _draw_splines_on_preview(self, preview_tensor: torch.Tensor, processed_coords_list: List[Path],
                                  path_pause_frames: List[Tuple[int, int]], total_frames: int,
@@ -617,48 +937,43 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                                  frame_width: int = DEFAULT_FRAME_WIDTH, frame_height: int = DEFAULT_FRAME_HEIGHT,
                                  layer_visibility: Optional[List[bool]] = None) -> torch.Tensor:
         """
-        Draw thin orange splines on the preview frames to visualize the paths.
+        Hook for drawing thin orange splines on the preview frames to visualize the paths.
         Works on already scaled (50%) preview tensor in BHWC format.
-        Returns modified tensor.
+        Spline drawing is currently disabled, so the tensor is returned unchanged
+        (without converting it to PIL first).
         """
-        batch_size, scaled_height, scaled_width, channels = preview_tensor.shape
-        scale_factor = PREVIEW_SCALE_FACTOR  # Preview is scaled to 50%
-
-        # Convert tensor to list of PIL images for drawing
-        preview_pil_list = []
-        for i in range(batch_size):
-            frame_np = (preview_tensor[i].cpu().numpy() * 255).astype('uint8')
-            pil_img = Image.fromarray(frame_np, mode='RGB')
-            preview_pil_list.append(pil_img)
-
-        # Return input tensor unchanged, no preview lines drawn
         return preview_tensor
 
     # ----------------------------
     # Data processing helpers (all inside class)
     # ----------------------------
-    def _safe_json_load(self, text: str) -> Any:
+    def _safe_json_load(self, text: Union[str, bytes]) -> Any:
         """
-        Safely load JSON from string, trying to tolerate single quotes by replacing them.
-        Returns parsed JSON or raises JSONDecodeError.
+        Safely load JSON from a string (or UTF-8 bytes, which orjson parses without a copy),
+        trying to tolerate single quotes by replacing them.
+        Returns parsed JSON or raises ValueError (JSONDecodeError for the stdlib parser).
         """
-        if not isinstance(text, str):
+        if isinstance(text, (bytes, bytearray)):
+            single_quote, double_quote = b"'", b'"'
+        elif isinstance(text, str):
+            single_quote, double_quote = "'", '"'
+        else:
             raise TypeError("Expected JSON string")
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return _json_loads(text)
+        except ValueError:  # json/orjson JSONDecodeError and ujson errors all subclass ValueError
             # Try replacing single quotes with double quotes (best-effort)
-            return json.loads(text.replace("'", '"'))
+            return _json_loads(text.replace(single_quote, double_quote))
 
     def _parse_coordinate_metadata(self, coordinates_str: str) -> Tuple[
-            Optional[str], Optional[str], Optional[str], Dict[str, Any]]:
+            Union[list, str, None], Union[list, str, None], Union[list, str, None], Dict[str, Any]]:
         """
         Parse the top-level coordinates string which may either be:
          - a JSON object containing metadata and 'coordinates'/'p_coordinates'
          - a plain JSON array / path list (older format)
-        Returns (coordinates_data, p_coordinates_data, metadata_dict)
-        where coordinates_data/p_coordinates_data are either JSON strings or None,
-        and metadata_dict contains extracted fields (with defaults).
+        Returns (coordinates_data, p_coordinates_data, box_coordinates_data, metadata_dict)
+        where the *_data values are the already-parsed sections (or the raw string if
+        it could not be parsed, or None), and metadata_dict contains extracted fields (with defaults).
         """
         metadata = {
             "start_p_frames": 0,
@@ -688,11 +1003,11 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
             if isinstance(parsed, dict):
                 # Extract common fields safely
                 if "coordinates" in parsed:
-                    coordinates_data = json.dumps(parsed["coordinates"])
+                    coordinates_data = parsed["coordinates"]
                 if "p_coordinates" in parsed:
-                    p_coordinates_data = json.dumps(parsed["p_coordinates"])
+                    p_coordinates_data = parsed["p_coordinates"]
                 if "box_coordinates" in parsed:
-                    box_coordinates_data = json.dumps(parsed["box_coordinates"])
+                    box_coordinates_data = parsed["box_coordinates"]
                 for k in ("start_p_frames", "end_p_frames", "offsets", "interpolations", "easing_functions", "easing_paths", "easing_strengths", "accelerations", "scales", "drivers", "p_coordinates_use_driver", "static_points_driver_path", "static_points_driver_smooth", "coord_width", "coord_height"):
                     if k in parsed:
                         metadata[k] = parsed[k]
@@ -701,22 +1016,22 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                         metadata[k] = parsed[k]
             else:
                 # Not an object: treat as raw coordinates
-                coordinates_data = coordinates_str
+                coordinates_data = parsed
         except Exception:
             # Fall back to treating string as raw coordinates
             coordinates_data = coordinates_str
 
         return coordinates_data, p_coordinates_data, box_coordinates_data, metadata
 
-    def _parse_animated_paths(self, data_str: Optional[str], label: str) -> List[Path]:
+    def _parse_animated_paths(self, data: Union[list, str, None], label: str) -> List[Path]:
         """
-        Parse a JSON string representing animated paths. Returns a list of paths (each is a list of coords).
-        Raises ValueError if the format isn't recognized.
+        Normalise animated paths (already parsed, or a JSON string) into a list of paths
+        (each is a list of coords). Raises ValueError if the format isn't recognized.
         """
-        if not data_str:
+        if not data:
             return []
 
-        parsed = self._safe_json_load(data_str)
+        parsed = self._safe_json_load(data) if isinstance(data, str) else data
         if isinstance(parsed, list):
             if len(parsed) == 0:
                 return []
@@ -726,26 +1041,29 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
             if isinstance(first, dict):
                 return [parsed]
         raise ValueError(f"Unexpected coordinate format for {label}")
-    def _parse_static_points(self, p_coordinates_json: Optional[str]) -> List[List[Coord]]:
+    def _parse_static_points(self, p_coordinates: Union[list, str, None]) -> List[List[Coord]]:
         """
-        Parse static p_coordinates JSON string into a list of point layers.
+        Parse static p_coordinates (already parsed, or a JSON string) into a list of point layers.
         Each layer is a list of coordinate dicts.
         Returns [] if none or invalid.
         """
-        if not p_coordinates_json:
+        if not p_coordinates:
             return []
 
         static_point_layers: List[List[Coord]] = []
         try:
-            parsed = self._safe_json_load(p_coordinates_json)
+            parsed = self._safe_json_load(p_coordinates) if isinstance(p_coordinates, str) else p_coordinates
             if isinstance(parsed, list):
                 # Could be list of dicts or list of lists
                 if parsed and isinstance(parsed[0], dict):
                     # Single layer of points
+                    # The parsed dicts are not shared, so x/y are coerced in place instead of copying each point
                     layer = []
                     for p in parsed:
                         if isinstance(p, dict) and 'x' in p and 'y' in p:
-                            layer.append({'x': float(p['x']), 'y': float(p['y']), **{k: v for k, v in p.items() if k not in ('x', 'y')}})
+                            p['x'] = float(p['x'])
+                            p['y'] = float(p['y'])
+                            layer.append(p)
                     static_point_layers.append(layer)
                 else:
                     # Multiple layers - preserve structure
@@ -754,13 +1072,17 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                             layer = []
                             for p in sub:
                                 if isinstance(p, dict) and 'x' in p and 'y' in p:
-                                    layer.append({'x': float(p['x']), 'y': float(p['y']), **{k: v for k, v in p.items() if k not in ('x', 'y')}})
+                                    p['x'] = float(p['x'])
+                                    p['y'] = float(p['y'])
+                                    layer.append(p)
                             static_point_layers.append(layer)
                         elif isinstance(sub, list) and not sub:
                             static_point_layers.append([])
                         elif isinstance(sub, dict) and 'x' in sub and 'y' in sub:
                             # Single point as a layer
-                            static_point_layers.append([{'x': float(sub['x']), 'y': float(sub['y']), **{k: v for k, v in sub.items() if k not in ('x', 'y')}}])
+                            sub['x'] = float(sub['x'])
+                            sub['y'] = float(sub['y'])
+                            static_point_layers.append([sub])
         except Exception:
             # On any parse error, return empty list
             return []
@@ -778,10 +1100,132 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
             raw_names = names_meta.get(key, [])
             if isinstance(raw_names, list):
                 result = [str(name) for name in raw_names[:count]]
-        while len(result) < count:
-            result.append(f"{fallback_prefix}{len(result) + 1}")
+        result.extend(f"{fallback_prefix}{i + 1}" for i in range(len(result), count))
         return result
 
+    def _normalize_meta_list(self, meta_value: Any, key: str, count: int, default: Any) -> List[Any]:
+        """
+        Per-layer list of `count` values from a metadata field that may be a {layer_type: value}
+        dict, a list or a single value. Lists are trimmed / padded with default; a missing
+        dict key or None gives default.
+        """
+        value = meta_value.get(key, default) if isinstance(meta_value, dict) else meta_value
+        if value is None:
+            value = default
+        if not isinstance(value, list):
+            return [value] * count
+        return value[:count] + [default] * (count - len(value))
+
+    def _normalize_meta_ints(self, meta_value: Any, key: str, count: int) -> List[int]:
+        """_normalize_meta_list() with every entry converted to int (0 when it can't be)."""
+        cleaned = []
+        for value in self._normalize_meta_list(meta_value, key, count, 0):
+            try:
+                cleaned.append(int(value))
+            except (ValueError, TypeError):
+                cleaned.append(0)
+        return cleaned
+
+    def _make_track(self, xy: np.ndarray, visibility: Union[int, np.ndarray]) -> np.ndarray:
+        """
+        Pack float (N, 2) positions and visibility into a preallocated int32 (N, 3) ATI track.
+        Positions are truncated toward zero, matching int().
+        """
+        track = np.empty((xy.shape[0], 3), dtype=np.int32)
+        track[:, :2] = xy
+        track[:, 2] = visibility
+        return track
+
+    def _box_driven_positions(self, positions: np.ndarray, path_x: np.ndarray, path_y: np.ndarray,
+                              eff_frames: np.ndarray, box_path: List[Dict[str, Any]],
+                              box_scale_profile: Optional[List[float]]) -> np.ndarray:
+        """
+        Move per-frame (N, 2) path positions with a box driver sampled at eff_frames.
+        Positions are scaled around the path's first key by the box scale relative to its
+        first frame, rotated by the relative box rotation around the path's transformed
+        bounding center, then shifted by the box movement since its first key.
+        """
+        num_keys = len(box_path)
+        # Unparsable box keys stay at the first key's position
+        box_xy, valid = _path_xy(box_path)
+        box_xy[~valid] = box_xy[0]
+        box_r = np.zeros(num_keys, dtype=np.float64)
+        for k, box_pt in enumerate(box_path):
+            try:
+                box_r[k] = float(box_pt.get("boxR", 0.0) or 0.0)
+            except (TypeError, ValueError):
+                box_r[k] = box_r[0]
+
+        box_scale = np.ones(num_keys, dtype=np.float64)
+        if isinstance(box_scale_profile, list) and box_scale_profile:
+            try:
+                scale0 = float(box_scale_profile[0]) or 1.0
+            except (TypeError, ValueError):
+                scale0 = 1.0
+            box_scale[:] = scale0
+            for k, value in enumerate(box_scale_profile[:num_keys]):
+                try:
+                    box_scale[k] = float(value)
+                except (TypeError, ValueError):
+                    pass
+            box_scale /= scale0
+
+        box_idx = np.minimum(eff_frames, num_keys - 1)
+        scale_rel = box_scale[box_idx, None]
+        delta = box_xy[box_idx] - box_xy[0]
+        delta_rot = box_r[box_idx] - box_r[0]
+
+        origin = np.array([path_x[0], path_y[0]])
+        center = np.array([(path_x.min() + path_x.max()) * 0.5, (path_y.min() + path_y.max()) * 0.5])
+        positions = origin + (positions - origin) * scale_rel + delta
+        pivot = origin + (center - origin) * scale_rel + delta
+
+        rotated = np.abs(delta_rot) > 1e-4
+        if rotated.any():
+            cos_r = np.cos(delta_rot[rotated])
+            sin_r = np.sin(delta_rot[rotated])
+            pivot = pivot[rotated]
+            rel_x, rel_y = (positions[rotated] - pivot).T
+            positions[rotated] = np.column_stack((pivot[:, 0] + rel_x * cos_r - rel_y * sin_r,
+                                                  pivot[:, 1] + rel_x * sin_r + rel_y * cos_r))
+        return positions
+
+    def _points_layer_positions(self, positions: np.ndarray, layer_xy: np.ndarray, view: _DriverView,
+                                frame_indices: np.ndarray) -> np.ndarray:
+        """
+        Move per-frame (N, 2) positions of a driven points-mode layer the way _draw_single_frame_pil
+        draws the layer: shifted by the driver offset, then rotated by the box rotation around the
+        bounding center of the shifted layer points (layer_xy, the _points_mode_arrays() entry).
+        """
+        eff_frames = np.maximum(0, frame_indices - view.pos_delay + view.neg_lead)
+        offsets = view.offsets[np.minimum(eff_frames, len(view.offsets) - 1)]
+        positions = positions + offsets
+        if not view.box_rotations or len(layer_xy) == 0:
+            return positions
+
+        box_rotations = np.asarray(view.box_rotations, dtype=np.float64)
+        rotation = box_rotations[np.minimum(eff_frames, len(box_rotations) - 1)]
+        rotated = np.abs(rotation) >= 1e-4
+        if rotated.any():
+            cos_r = np.cos(rotation[rotated])
+            sin_r = np.sin(rotation[rotated])
+            pivot = (layer_xy.min(axis=0) + layer_xy.max(axis=0)) * 0.5 + offsets[rotated]
+            rel_x, rel_y = (positions[rotated] - pivot).T
+            positions[rotated] = np.column_stack((pivot[:, 0] + rel_x * cos_r - rel_y * sin_r,
+                                                  pivot[:, 1] + rel_x * sin_r + rel_y * cos_r))
+        return positions
+
+    def _fade_visibility(self, fade_start: float, total_frames: int) -> np.ndarray:
+        """
+        Per-frame ATI visibility flags for a fade start given as a fraction of total_frames.
+        Frames before the fade start are visible (1), later frames are hidden (0);
+        a fade start of 0 keeps every frame visible.
+        """
+        visibility = np.ones(total_frames, dtype=np.int8)
+        if fade_start > 0:
+            visibility[int(fade_start * total_frames):] = 0
+        return visibility
+
     def _compute_frame_dimensions(self, bg_image: torch.Tensor) -> Tuple[int, int]:
         """
         Extract width and height from bg_image tensor (expected BHWC).
@@ -796,64 +1240,97 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
     # ----------------------------
     # Post-processing helpers
     # ----------------------------
-    def _postprocess_frames_to_tensors(self, pil_images: List[Image.Image], frame_width: int, frame_height: int,
-                                       trailing: float, intensity: float) -> Tuple[torch.Tensor, torch.Tensor]:
+    def _blur_frames(self, frames: np.ndarray, blur_radius: float) -> np.ndarray:
         """
-        Convert list of PIL images (length = batch_size) into:
+        Gaussian-blur a (N, H, W, 3) uint8 batch at once with two separable 1-D passes over H and W.
+        Returns a uint8 array; blur_radius is the standard deviation, as for ImageFilter.GaussianBlur.
+        Without scipy each frame is blurred with PIL instead.
+        """
+        if gaussian_filter1d is None:
+            return np.stack([np.asarray(Image.fromarray(frame).filter(ImageFilter.GaussianBlur(blur_radius)))
+                             for frame in frames])
+        frames = frames.astype(np.float32)
+        gaussian_filter1d(frames, sigma=blur_radius, axis=1, mode="nearest", output=frames)
+        gaussian_filter1d(frames, sigma=blur_radius, axis=2, mode="nearest", output=frames)
+        np.rint(frames, out=frames)
+        np.clip(frames, 0.0, 255.0, out=frames)
+        return frames.astype(np.uint8)
+
+    def _frame_array(self, image: Optional[Union[Image.Image, np.ndarray]], black_frame: np.ndarray) -> np.ndarray:
+        """HWC uint8 RGB view of a frame (no copy for RGB images and uint8 arrays); None gives black_frame."""
+        if image is None:
+            return black_frame
+        if isinstance(image, Image.Image) and image.mode != "RGB":
+            image = image.convert("RGB")
+        return np.asarray(image, dtype=np.uint8)
+
+    def _downscale_half(self, frames: torch.Tensor) -> torch.Tensor:
+        """
+        Downscale a [B, C, H, W] batch to half size (bilinear). For even sizes a 2x2 average
+        pool samples exactly the same pixels, without the interpolation grid setup.
+        Callers pass NHWC tensors permuted to NCHW: that is channels_last memory, which the
+        pooling and interpolation kernels keep, so permuting the result back is a free view.
+        """
+        height, width = frames.shape[2], frames.shape[3]
+        if height % 2 == 0 and width % 2 == 0:
+            return torch.nn.functional.avg_pool2d(frames, kernel_size=2, stride=2)
+        # antialias stays off explicitly: the preview has always used plain bilinear sampling
+        return torch.nn.functional.interpolate(frames, size=(height // 2, width // 2),
+                                               mode='bilinear', align_corners=False, antialias=False)
+
+    def _postprocess_frames_to_tensors(self, pil_images: Union[np.ndarray, List[Optional[Union[Image.Image, np.ndarray]]]],
+                                       frame_width: int, frame_height: int,
+                                       trailing: float, intensity: float,
+                                       blur_radius: float = 0.0) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Convert a (N, H, W, 3) uint8 array, or a list of PIL images / HWC uint8 RGB arrays
+        (length = batch_size, None for a black frame), into:
          - out_images (BHWC float tensor)
          - out_masks (BHW float tensor)
-        Applies trailing and intensity in CHW domain.
+        Applies the batched blur (if blur_radius > 0), then trailing and intensity in BHWC layout
+        as in-place ops on one preallocated batch tensor.
         """
-        images_list_bchw = []
-        masks_list_bhw = []
-        previous_output_chw = None
-
-        for i, pil_image in enumerate(pil_images):
-            if pil_image is None:
-                pil_image = Image.new("RGB", (frame_width, frame_height), (0, 0, 0))
-
-            image_tensor_bhwc = pil2tensor(pil_image)  # expects [1, H, W, C] float32 0..1
-            # Validate shape and fallback if necessary
-            if image_tensor_bhwc.ndim != 4 or image_tensor_bhwc.shape[0] != 1:
-                image_tensor_bhwc = torch.zeros([1, frame_height, frame_width, 3], dtype=torch.float32)
-
-            image_tensor_chw = image_tensor_bhwc[0].permute(2, 0, 1)  # [C, H, W]
-
-            # Trailing effect - 0.0 = no trailing, 1.0 = max trailing
-            if trailing > 0.0 and previous_output_chw is not None:
-                try:
-                    if previous_output_chw.device != image_tensor_chw.device:
-                        previous_output_chw = previous_output_chw.to(image_tensor_chw.device)
-                    image_tensor_chw = image_tensor_chw + trailing * previous_output_chw
-                    image_tensor_chw = torch.clamp(image_tensor_chw, 0.0, 1.0)
-                except Exception:
-                    pass
+        if len(pil_images) == 0:
+            return (torch.zeros([1, frame_height, frame_width, 3], dtype=torch.float32),
+                    torch.zeros([1, frame_height, frame_width], dtype=torch.float32))
 
-            previous_output_chw = image_tensor_chw.clone() if trailing > 0.0 else None
+        if isinstance(pil_images, np.ndarray):
+            frames_uint8 = pil_images
+        else:
+            # None frames are black and get blurred with the rest of the batch
+            black_frame = np.zeros((frame_height, frame_width, 3), dtype=np.uint8)
+            frames_uint8 = np.stack([self._frame_array(image, black_frame) for image in pil_images])
 
-            # Apply intensity
-            image_tensor_chw = image_tensor_chw * float(intensity)
-            image_tensor_chw = torch.clamp(image_tensor_chw, 0.0, 1.0)
+        if blur_radius and blur_radius > 0.0:
+            frames_uint8 = self._blur_frames(frames_uint8, blur_radius)
 
-            # Mask = red channel (index 0) per original code
-            mask_tensor_hw = image_tensor_chw[0, :, :].clone()
+        # One uint8 -> float32 conversion for the whole batch
+        frames_bhwc = torch.empty((len(frames_uint8), frame_height, frame_width, 3), dtype=torch.float32)
+        frames_bhwc.copy_(torch.from_numpy(frames_uint8)).div_(255.0)
 
-            masks_list_bhw.append(mask_tensor_hw.unsqueeze(0))
-            images_list_bchw.append(image_tensor_chw.unsqueeze(0))
+        # Trailing effect - 0.0 = no trailing, 1.0 = max trailing.
+        # Each frame adds the previous frame's trailed (pre-intensity) value, in place.
+        if trailing > 0.0:
+            trailed = torch.empty_like(frames_bhwc[0])
+            for i in range(1, len(frames_bhwc)):
+                torch.mul(frames_bhwc[i - 1], trailing, out=trailed)
+                frames_bhwc[i].add_(trailed).clamp_(0.0, 1.0)
 
-        if not images_list_bchw or not masks_list_bhw:
-            return (torch.zeros([1, frame_height, frame_width, 3], dtype=torch.float32),
-                    torch.zeros([1, frame_height, frame_width], dtype=torch.float32))
+        # Apply intensity to the whole batch
+        out_images = frames_bhwc.mul_(float(intensity)).clamp_(0.0, 1.0)
 
-        out_images_bchw = torch.cat(images_list_bchw, dim=0)
-        out_images = out_images_bchw.permute(0, 2, 3, 1).cpu().float()
-        out_masks = torch.cat(masks_list_bhw, dim=0).cpu().float()
-
-        out_images = torch.clamp(out_images, 0.0, 1.0)
-        out_masks = torch.clamp(out_masks, 0.0, 1.0)
+        # Mask = red channel (index 0) per original code, copied so it doesn't alias the images
+        out_masks = out_images[..., 0].clone()
 
         return out_images, out_masks
 
+    def _empty_result(self, frame_width: int, frame_height: int) -> Tuple[torch.Tensor, torch.Tensor, str, torch.Tensor]:
+        """Node outputs for a run with nothing to draw: one black frame, an empty mask, no tracks and a 1x1 preview."""
+        empty_image = torch.zeros([1, frame_height, frame_width, 3], dtype=torch.float32)
+        empty_mask = torch.zeros([1, frame_height, frame_width], dtype=torch.float32)
+        empty_preview = torch.zeros([1, 1, 1, 3], dtype=torch.float32)  # 1x1 pixel for efficiency
+        return (empty_image, empty_mask, "[]", empty_preview)
+
     # ----------------------------
     # Main Node Method
     # ----------------------------
@@ -875,9 +1352,21 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
         # Note: easing_function, easing_path, and easing_strength are now passed directly as parameters
 
         # ----- Parse coordinate metadata & static points -----
-        coordinates_data, p_coordinates_data, box_coordinates_data, meta = self._parse_coordinate_metadata(coordinates)
+        coordinates_data, p_coordinates_data, _box_coordinates_data, meta = self._parse_coordinate_metadata(coordinates)
         static_point_layers = self._parse_static_points(p_coordinates_data)
 
+        # Unpack the metadata fields used by several stages below once, up front
+        start_p_frames_meta = meta.get("start_p_frames", 0)
+        end_p_frames_meta = meta.get("end_p_frames", 0)
+        offsets_meta = meta.get("offsets", 0)
+        scales_meta = meta.get("scales", 1.0)
+        interpolations_meta = meta.get("interpolations", 'linear')
+        accelerations_meta = meta.get("accelerations", 0.00)
+        easing_functions_meta = meta.get("easing_functions", "in_out")
+        easing_paths_meta = meta.get("easing_paths", "full")
+        easing_strengths_meta = meta.get("easing_strengths", 1.0)
+        drivers_meta = meta.get("drivers", None)
+
         # Driver metadata for static points (older and newer logic)
         static_points_use_driver = bool(meta.get("p_coordinates_use_driver", False))
         static_points_driver_path_raw = meta.get("static_points_driver_path", None)
@@ -888,8 +1377,8 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
         static_points_driver_info_list: List[Optional[Dict[str, Any]]] = [None] * num_static_point_layers
 
         # Attempt to find a driver path inside drivers metadata if present
-        if isinstance(meta.get("drivers"), dict):
-            p_drivers = meta["drivers"].get("p")
+        if isinstance(drivers_meta, dict):
+            p_drivers = drivers_meta.get("p")
             # Check if we have drivers for static points
             if isinstance(p_drivers, list) and p_drivers:
                 # Process each driver for static points, preserving layer order
@@ -906,6 +1395,16 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
 
         # ----- Frame dimensions and scaling -----
         frame_width, frame_height = self._compute_frame_dimensions(bg_image)
+
+        try:
+            # Box coordinates are only used indirectly via drivers.meta['path'],
+            # so they are neither drawn nor parsed here.
+            coords_list_raw = self._parse_animated_paths(coordinates_data, "coordinates")
+        except Exception:
+            return self._empty_result(frame_width, frame_height)
+        if not coords_list_raw and not static_point_layers:
+            # Nothing to draw: skip driver resolution, interpolation and rendering entirely
+            return self._empty_result(frame_width, frame_height)
         coord_width = meta.get("coord_width", None)
         coord_height = meta.get("coord_height", None)
 
@@ -928,9 +1427,9 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
 
         # Interpolate static_points_driver_path to total_frames and apply smoothing
         # For static points, use the easing parameters from metadata
-        easing_function = meta.get("easing_functions", "in_out")
-        easing_path = meta.get("easing_paths", "full")
-        easing_strength = meta.get("easing_strengths", 1.0)
+        easing_function = easing_functions_meta
+        easing_path = easing_paths_meta
+        easing_strength = easing_strengths_meta
 
         # Store interpolated driver paths for each static point layer
         static_points_interpolated_drivers: List[Optional[Dict[str, Any]]] = []
@@ -940,14 +1439,15 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
             static_points_interpolated_drivers = [None] * len(static_points_driver_info_list)
             for idx, driver_info in enumerate(static_points_driver_info_list):
                 if driver_info and isinstance(driver_info, dict):
-                    driver_path = driver_info.get('path')
-                    driver_rotate = driver_info.get('rotate', 0.0)
-                    driver_d_scale = driver_info.get('d_scale', DRIVER_SCALE_FACTOR)
+                    driver_get = driver_info.get
+                    driver_path = driver_get('path')
+                    driver_rotate = driver_get('rotate', 0.0)
+                    driver_d_scale = driver_get('d_scale', DRIVER_SCALE_FACTOR)
 
                     # Use driver's own interpolation parameters if available, otherwise fall back to defaults
-                    driver_easing_function = driver_info.get('easing_function', easing_function)
-                    driver_easing_path = driver_info.get('easing_path', easing_path)
-                    driver_easing_strength = driver_info.get('easing_strength', easing_strength)
+                    driver_easing_function = driver_get('easing_function', easing_function)
+                    driver_easing_path = driver_get('easing_path', easing_path)
+                    driver_easing_strength = driver_get('easing_strength', easing_strength)
 
                     if driver_path and len(driver_path) > 0:
                         interpolated = process_driver_path(
@@ -956,13 +1456,13 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                             TRAILING_WEIGHT_FACTOR, rotate_degrees=driver_rotate
                         )
                         if interpolated:
-                            scale_profile = driver_info.get('driver_scale_profile', [])
+                            scale_profile = driver_get('driver_scale_profile', [])
                             resampled_scale_profile = resample_scale_profile(
                                 scale_profile, len(interpolated),
                                 driver_easing_function, driver_easing_strength
                             )
-                            static_scale = float(resampled_scale_profile[-1]) if resampled_scale_profile else float(driver_info.get('driver_scale_factor', DRIVER_SCALE_FACTOR))
-                            driver_pivot = driver_info.get('driver_pivot')
+                            static_scale = float(resampled_scale_profile[-1]) if resampled_scale_profile else float(driver_get('driver_scale_factor', DRIVER_SCALE_FACTOR))
+                            driver_pivot = driver_get('driver_pivot')
                             if not driver_pivot and isinstance(interpolated[0], dict):
                                 try:
                                     driver_pivot = (
@@ -980,18 +1480,18 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                                 'easing_path': driver_easing_path,
                                 'easing_strength': driver_easing_strength,
                                 # Propagate driver's timing if present
-                                'start_pause': int(driver_info.get('start_pause', 0)),
-                                'end_pause': int(driver_info.get('end_pause', 0)),
-                                'offset': int(driver_info.get('offset', 0)),
+                                'start_pause': int(driver_get('start_pause', 0)),
+                                'end_pause': int(driver_get('end_pause', 0)),
+                                'offset': int(driver_get('offset', 0)),
                                 'driver_scale_profile': resampled_scale_profile,
                                 'driver_scale_factor': static_scale,
                                 'driver_pivot': driver_pivot,
-                                'driver_type': driver_info.get('driver_type'),
-                                'driver_radius_delta': driver_info.get('driver_radius_delta', 0.0),
+                                'driver_type': driver_get('driver_type'),
+                                'driver_radius_delta': driver_get('driver_radius_delta', 0.0),
                                 'driver_path_normalized': static_driver_normalized,
-                                'driver_layer_name': driver_info.get('driver_layer_name')
+                                'driver_layer_name': driver_get('driver_layer_name')
                             }
-                            static_points_interpolated_drivers[idx]['layer_name'] = static_layer_names[idx] if idx < len(static_layer_names) else f"P-Layer {idx + 1}"
+                            static_points_interpolated_drivers[idx]['layer_name'] = static_layer_names[idx]
                             static_points_interpolated_drivers[idx]['driver_path_key'] = 'path'
         elif static_points_use_driver and static_points_driver_path_processed:
             # Use the single driver for all layers (legacy mode)
@@ -1029,7 +1529,7 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                 static_points_interpolated_drivers = []
                 for idx in range(num_static_point_layers):
                     driver_copy = legacy_driver.copy()
-                    driver_copy['layer_name'] = static_layer_names[idx] if idx < len(static_layer_names) else f"P-Layer {idx + 1}"
+                    driver_copy['layer_name'] = static_layer_names[idx]
                     driver_copy['driver_path_key'] = 'path'
                     static_points_interpolated_drivers.append(driver_copy)
             else:
@@ -1042,7 +1542,7 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
         # Defer applying driver chain offsets for static layers until after animated paths are processed
 
         # Code-side fallback: automatically enable static_points_use_driver if drivers.p exists
-        if isinstance(meta.get("drivers"), dict) and meta["drivers"].get("p"):
+        if isinstance(drivers_meta, dict) and drivers_meta.get("p"):
             static_points_use_driver = True
 
         if static_points_use_driver and static_points_driver_path_processed:
@@ -1056,78 +1556,45 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                 TRAILING_WEIGHT_FACTOR,
             )
 
-        try:
-            coords_list_raw = self._parse_animated_paths(coordinates_data, "coordinates")
-            # Box coordinates are only used indirectly via drivers.meta['path'],
-            # so we don't merge them into the animated path list for drawing.
-            _ = self._parse_animated_paths(box_coordinates_data, "box coordinates")
-        except Exception:
-            empty_image = torch.zeros([1, frame_height, frame_width, 3], dtype=torch.float32)
-            empty_mask = torch.zeros([1, frame_height, frame_width], dtype=torch.float32)
-            empty_preview = torch.zeros([1, 1, 1, 3], dtype=torch.float32)
-            return (empty_image, empty_mask, "[]", empty_preview)
         layer_names = normalize_layer_names(meta, len(coords_list_raw), names_key="c", fallback_prefix="Layer")
         coord_types_raw = meta.get("types", {}).get("c", [])
         coord_types = list(coord_types_raw) if isinstance(coord_types_raw, list) else []
+        # Padded to one entry per path (as build_interpolated_paths does), like the visibility lists below
+        coord_types = coord_types[:len(coords_list_raw)] + ['path'] * (len(coords_list_raw) - len(coord_types))
         coord_visibility_meta = meta.get("visibility", {})
-        coord_visibility_list: List[bool] = []
-        if isinstance(coord_visibility_meta, dict):
-            raw_vis = coord_visibility_meta.get("c")
-            if isinstance(raw_vis, list):
-                coord_visibility_list = [bool(v) for v in raw_vis[:len(coords_list_raw)]]
-            elif isinstance(raw_vis, (bool, int)):
-                coord_visibility_list = [bool(raw_vis)] * len(coords_list_raw)
-        if len(coord_visibility_list) < len(coords_list_raw):
-            coord_visibility_list.extend([True] * (len(coords_list_raw) - len(coord_visibility_list)))
-
-        static_points_visibility_list: List[bool] = []
-        if isinstance(coord_visibility_meta, dict):
-            raw_vis = coord_visibility_meta.get("p")
-            if isinstance(raw_vis, list):
-                static_points_visibility_list = [bool(v) for v in raw_vis[:num_static_point_layers]]
-            elif isinstance(raw_vis, (bool, int)):
-                static_points_visibility_list = [bool(raw_vis)] * num_static_point_layers
-        if len(static_points_visibility_list) < num_static_point_layers:
-            static_points_visibility_list.extend([True] * (num_static_point_layers - len(static_points_visibility_list)))
+        if not isinstance(coord_visibility_meta, dict):
+            coord_visibility_meta = {}
+        coord_visibility_list = [bool(v) for v in self._normalize_meta_list(
+            coord_visibility_meta, "c", len(coords_list_raw), True)]
+        static_points_visibility_list = [bool(v) for v in self._normalize_meta_list(
+            coord_visibility_meta, "p", num_static_point_layers, True)]
 
         box_paths_count = 0
 
 
         # If coords_list_raw needs scaling because coord_width/coord_height differ
         if coord_width and coord_height and (coord_width != frame_width or coord_height != frame_height):
-            scaled_coords_list = []
             scale_x = float(frame_width) / float(coord_width)
             scale_y = float(frame_height) / float(coord_height)
-            for path in coords_list_raw:
-                scaled_path = []
-                for point in path:
-                    if isinstance(point, dict) and 'x' in point and 'y' in point:
-                        sp = {**point}
-                        sp['x'] = float(point['x']) * scale_x
-                        sp['y'] = float(point['y']) * scale_y
-                        scaled_path.append(sp)
-                scaled_coords_list.append(scaled_path)
+            scaled_coords_list = [
+                scale_path_points([point for point in path if isinstance(point, dict) and 'x' in point and 'y' in point],
+                                  scale_x, scale_y)
+                for path in coords_list_raw
+            ]
             coords_list_raw = scaled_coords_list
 
         # ----- Build interpolated/resampled animated paths -----
-        # Handle different formats for easing parameters - could be single values, lists, or objects
-        easing_functions_meta = meta.get("easing_functions", "in_out")
-        easing_paths_meta = meta.get("easing_paths", "full")
-        easing_strengths_meta = meta.get("easing_strengths", 1.0)
-        accelerations_meta = meta.get("accelerations", 0.00)
-        
-        # Get interpolations metadata to check for points mode
-        interpolations_meta = meta.get("interpolations", 'linear')
-        
+        # Easing parameters (unpacked above) may be single values, lists, or objects;
+        # interpolations_meta is also used below to check for points mode
         processed_coords_list, path_pause_frames, coords_driver_info_list, scales_list = build_interpolated_paths(
             coords_list_raw, total_frames,
-            meta.get("start_p_frames", 0), meta.get("end_p_frames", 0),
-            meta.get("offsets", 0), interpolations_meta,
-            meta.get("drivers", None),
+            start_p_frames_meta, end_p_frames_meta,
+            offsets_meta, interpolations_meta,
+            drivers_meta,
             easing_functions_meta,
             easing_paths_meta,
             easing_strengths_meta,
-            meta.get("scales", 1.0),
+            scales_meta,
             accelerations_meta,
             box_prefix_count=0,
             coord_width=coord_width, coord_height=coord_height, frame_width=frame_width, frame_height=frame_height,
@@ -1138,22 +1605,8 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
 
         # Normalize interpolations list to check for points mode
         num_paths = len(processed_coords_list)
-        interpolations_list = []
-        if isinstance(interpolations_meta, dict):
-            c_inter = interpolations_meta.get("c", 'linear')
-            if isinstance(c_inter, str):
-                interpolations_list = [c_inter] * num_paths
-            elif isinstance(c_inter, list):
-                interpolations_list = c_inter + ['linear'] * (num_paths - len(c_inter))
-            else:
-                interpolations_list = ['linear'] * num_paths
-        elif isinstance(interpolations_meta, str):
-            interpolations_list = [interpolations_meta] * num_paths
-        elif isinstance(interpolations_meta, list):
-            interpolations_list = interpolations_meta + ['linear'] * (num_paths - len(interpolations_meta))
-        else:
-            interpolations_list = ['linear'] * num_paths
-        
+        interpolations_list = self._normalize_meta_list(interpolations_meta, "c", num_paths, 'linear')
+
         # Apply driver offsets to processed coordinates after they've been interpolated with their own easing
         # This ensures that the driven layer's interpolation is preserved and the driver offset is added on top
         for path_idx, coords in enumerate(processed_coords_list):
@@ -1161,32 +1614,21 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                 driver_info = coords_driver_info_list[path_idx]
                 if driver_info and isinstance(driver_info, dict):
                     interpolated_driver = driver_info.get('interpolated_path')
-                    driver_pause_frames = driver_info.get('pause_frames', (0, 0))
-                    d_scale = driver_info.get('d_scale', 1.0)
                     if interpolated_driver and len(interpolated_driver) > 0:
-                        sanitized_info = dict(driver_info)
-                        sanitized_info['interpolated_path'] = interpolated_driver
-                        sanitized_info['pause_frames'] = driver_pause_frames
-                        sanitized_info['d_scale'] = d_scale
-                        sanitized_info['easing_function'] = driver_info.get('easing_function', 'linear')
-                        sanitized_info['easing_path'] = driver_info.get('easing_path', 'full')
-                        sanitized_info['easing_strength'] = driver_info.get('easing_strength', 1.0)
-                        sanitized_info['start_pause'] = int(driver_info.get('start_pause', 0))
-                        sanitized_info['end_pause'] = int(driver_info.get('end_pause', 0))
-                        sanitized_info['offset'] = int(driver_info.get('offset', 0))
-                        sanitized_info['driver_scale_factor'] = driver_info.get('driver_scale_factor', 1.0)
-                        sanitized_info['driver_scale_profile'] = driver_info.get('driver_scale_profile')
-                        sanitized_info['driver_pivot'] = driver_info.get('driver_pivot')
-                        sanitized_info['driver_type'] = driver_info.get('driver_type')
-                        sanitized_info['driver_path_normalized'] = driver_info.get('driver_path_normalized', True)
-                        sanitized_info['driver_layer_name'] = driver_info.get('driver_layer_name')
+                        # Defaults first so every field the frame code reads is present
+                        sanitized_info = {**_SANITIZED_DRIVER_DEFAULTS, **driver_info}
+                        sanitized_info['start_pause'] = int(sanitized_info['start_pause'])
+                        sanitized_info['end_pause'] = int(sanitized_info['end_pause'])
+                        sanitized_info['offset'] = int(sanitized_info['offset'])
                         sanitized_info['driver_path_key'] = 'interpolated_path'
                         sanitized_info['layer_name'] = layer_names[path_idx]
-                        print(f"[DriverDebug] sanitized layer={layer_names[path_idx]} driver_target={sanitized_info['driver_layer_name']} is_points={sanitized_info['is_points_mode']}")
 
                         # Check if this is a "points" type layer
-                        layer_type = coord_types[path_idx] if path_idx < len(coord_types) else ''
-                        sanitized_info['is_points_mode'] = ((path_idx < len(interpolations_list) and interpolations_list[path_idx] == 'points') or layer_type == 'points')
+                        layer_type = coord_types[path_idx]
+                        sanitized_info['is_points_mode'] = interpolations_list[path_idx] == 'points' or layer_type == 'points'
+                        log.debug("[DriverDebug] sanitized layer=%s driver_target=%s is_points=%s",
+                                  layer_names[path_idx], sanitized_info['driver_layer_name'],
+                                  sanitized_info['is_points_mode'])
                         coords_driver_info_list[path_idx] = sanitized_info
 
         base_layer_path_map = build_layer_path_map(layer_names, processed_coords_list)
@@ -1225,10 +1667,10 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                 names_key="p", path_key="path", fallback_prefix="P-Layer",
                 resolved_paths=resolved_driver_paths
             )
-            print(f"[DriverDebug] resolved static drivers: {list(resolved_driver_paths.keys())}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[DriverDebug] resolved static drivers: %s", list(resolved_driver_paths.keys()))
         
         # Extract scale for static points (p_coordinates) from scales metadata
-        scales_meta = meta.get("scales", 1.0)
         static_points_scale = 1.0
         static_points_scales_list = None  # Per-layer scales for p_coordinates
 
@@ -1256,71 +1698,95 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                 path_pause_frames = []
             else:
                 # No input to render - return empty tensors
-                empty_image = torch.zeros([1, frame_height, frame_width, 3], dtype=torch.float32)
-                empty_mask = torch.zeros([1, frame_height, frame_width], dtype=torch.float32)
-                empty_preview = torch.zeros([1, 1, 1, 3], dtype=torch.float32)  # 1x1 pixel for efficiency
-                return (empty_image, empty_mask, "[]", empty_preview)  # preview instead of frames
+                return self._empty_result(frame_width, frame_height)
 
-        # ----- Frame Generation (PIL) in threads -----
+        # ----- Frame Generation (PIL), threaded for longer batches -----
         batch_size = total_frames
-        pil_images: List[Optional[Image.Image]] = [None] * batch_size
+        # Every frame is drawn in place into its own slot of this buffer
+        frame_buffers = np.empty((batch_size, frame_height, frame_width, 4), dtype=np.uint8)
 
-        # Prepare arguments for thread execution
-        args_list = []
         # Build per-layer pause frames list for static points (p branch)
         num_static_layers = len(static_point_layers) if static_point_layers else 0
-        p_start_meta = meta.get("start_p_frames", 0)
-        p_end_meta = meta.get("end_p_frames", 0)
-        p_offsets_meta = meta.get("offsets", 0)
-        def to_list(meta_val):
-            if isinstance(meta_val, dict):
-                val = meta_val.get("p", 0)
+        p_start_list = self._normalize_meta_ints(start_p_frames_meta, "p", num_static_layers)
+        p_end_list = self._normalize_meta_ints(end_p_frames_meta, "p", num_static_layers)
+        p_offsets_list = self._normalize_meta_ints(offsets_meta, "p", num_static_layers)
+        static_points_pause_frames_list = list(zip(p_start_list, p_end_list))
+
+        driver_views = self._build_driver_views(
+            list(coords_driver_info_list or []) + list(static_points_interpolated_drivers or []),
+            frame_width, frame_height)
+        path_positions = self._resolve_path_positions(processed_coords_list, path_pause_frames, total_frames,
+                                                      frame_width, frame_height, coords_driver_info_list,
+                                                      driver_views)
+        path_driver_views = self._path_driver_views(len(processed_coords_list), coords_driver_info_list,
+                                                    driver_views, frame_width, frame_height)
+        static_driver_views = self._static_layer_driver_views(
+            len(static_point_layers) if static_point_layers else 0, static_points_use_driver,
+            static_points_interpolated_drivers, driver_views, frame_width, frame_height)
+        bg_template = Image.new("RGB", (frame_width, frame_height), bg_color)
+        bg_frame = np.asarray(bg_template.convert("RGBX"))
+        static_layer_arrays = self._static_layer_arrays(static_point_layers)
+        points_mode_arrays = self._points_mode_arrays(processed_coords_list, path_driver_views)
+        # With scipy the blur runs once over the stacked batch in post-processing instead of per frame
+        frame_blur_radius = blur_radius if gaussian_filter1d is None else 0.0
+        batch_blur_radius = 0.0 if gaussian_filter1d is None else blur_radius
+        # Plain circle/square paths render as one numba stamping pass over the whole batch
+        path_visible = np.array(coord_visibility_list[:len(processed_coords_list)], dtype=bool)
+        static_layers_drawn = any(points and visible
+                                  for points, visible in zip(static_point_layers, static_points_visibility_list))
+        points_mode_drawn = any(view is not None and view.is_points_mode and path_visible[path_idx]
+                                for path_idx, view in enumerate(path_driver_views))
+        path_widths, path_heights = self._path_shape_sizes(len(processed_coords_list), shape_width,
+                                                           shape_height, scales_list)
+        stamped = False
+        if frame_blur_radius == 0.0 and not static_layers_drawn and not points_mode_drawn:
+            stamped = self._stamp_path_frames(frame_buffers, bg_frame, path_positions, path_widths,
+                                              path_heights, path_visible, shape, shape_color,
+                                              border_width, border_color)
+
+        if not stamped:
+            # Frames where no visible path has a position only show the background; fill those directly
+            if static_layers_drawn or points_mode_drawn:
+                frame_drawn = np.ones(batch_size, dtype=bool)
             else:
-                val = meta_val
-            if isinstance(val, list):
-                out = val
+                frame_drawn = ~np.isnan(path_positions[path_visible, :, 0]).all(axis=0)
+            if not frame_drawn.all():
+                frame_buffers[~frame_drawn] = bg_frame
+
+            ctx = _FrameContext(
+                frame_buffers=frame_buffers, bg_frame=bg_frame, bg_template=bg_template,
+                processed_coords_list=processed_coords_list, total_frames=total_frames,
+                frame_width=frame_width, frame_height=frame_height,
+                shape=shape, shape_width=shape_width, shape_height=shape_height, shape_color=shape_color,
+                border_width=border_width, border_color=border_color, blur_radius=frame_blur_radius,
+                path_widths=path_widths.tolist(), path_heights=path_heights.tolist(),
+                layer_visibility=coord_visibility_list, path_positions=path_positions,
+                path_driver_views=path_driver_views, points_mode_arrays=points_mode_arrays,
+                static_point_layers=static_point_layers, static_points_scale=static_points_scale,
+                static_points_scales_list=static_points_scales_list,
+                static_points_pause_frames_list=static_points_pause_frames_list,
+                static_points_offsets_list=p_offsets_list,
+                static_points_visibility_list=static_points_visibility_list,
+                static_layer_arrays=static_layer_arrays, static_driver_views=static_driver_views,
+            )
+            frame_indices = np.flatnonzero(frame_drawn).tolist()
+            if len(frame_indices) < PARALLEL_FRAME_THRESHOLD:
+                self._draw_frame_chunk(ctx, frame_indices)
             else:
-                out = [val] * max(1, num_static_layers)
-            # pad or trim
-            if len(out) < num_static_layers:
-                out = out + [0] * (num_static_layers - len(out))
-            elif len(out) > num_static_layers:
-                out = out[:num_static_layers]
-            # ensure ints
-            cleaned = []
-            for x in out:
+                # A few contiguous chunks per worker: dispatch cost is paid per chunk, and idle
+                # workers still pick up the remaining chunks when some frames are heavier
+                chunk_size = max(1, len(frame_indices) // (_FRAME_POOL_WORKERS * 4))
+                chunks = [frame_indices[start:start + chunk_size]
+                          for start in range(0, len(frame_indices), chunk_size)]
                 try:
-                    cleaned.append(int(x))
-                except (ValueError, TypeError):
-                    cleaned.append(0)
-            return cleaned
-        p_start_list = to_list(p_start_meta) if num_static_layers else []
-        p_end_list = to_list(p_end_meta) if num_static_layers else []
-        p_offsets_list = to_list(p_offsets_meta) if num_static_layers else []
-        static_points_pause_frames_list = [(p_start_list[i], p_end_list[i]) for i in range(num_static_layers)] if num_static_layers else []
-
-        for i in range(batch_size):
-            args_list.append((
-                i, processed_coords_list, path_pause_frames, total_frames,
-                frame_width, frame_height, shape_width, shape_height,
-                shape_color, bg_color, blur_radius, shape, border_width, border_color,
-                static_point_layers, static_points_use_driver, static_points_driver_path_processed,
-                static_points_pause_frames_list, coords_driver_info_list, scales_list,
-                static_points_scale, static_points_scales_list,
-                static_points_driver_info_list, static_points_interpolated_drivers,
-                resolved_driver_paths, coord_visibility_list, p_offsets_list, static_points_visibility_list
-            ))
-
-        try:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                results = list(executor.map(lambda p: self._draw_single_frame_pil(*p), args_list))
-                pil_images = results
-        except Exception:
-            # Fallback to sequential generation if threading fails
-            pil_images = [self._draw_single_frame_pil(*a) for a in args_list]
+                    list(_get_frame_pool().map(functools.partial(self._draw_frame_chunk, ctx), chunks))
+                except Exception:
+                    # Fallback to sequential generation if threading fails
+                    self._draw_frame_chunk(ctx, frame_indices)
 
         # ----- Post-processing into tensors (apply trailing & intensity) -----
-        out_images, out_masks = self._postprocess_frames_to_tensors(pil_images, frame_width, frame_height, trailing, intensity)
+        out_images, out_masks = self._postprocess_frames_to_tensors(frame_buffers[..., :3], frame_width, frame_height, trailing, intensity,
+                                                                    batch_blur_radius)
 
         # Note: Preview will be created after building ATI tracks (below)
 
@@ -1329,188 +1795,68 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
         # Generate coordinate tracks with visibility in the third component
         output_coords_json = "[]"
         all_coords = []
-        
+
+        # Per-frame visibility for each fade setting, shared by every track that uses it
+        animated_visibility = self._fade_visibility(animated_fade_start, total_frames)
+        static_visibility = self._fade_visibility(static_fade_start, total_frames)
+        frame_indices = np.arange(total_frames)
+
         # Process animated paths (affected by animated_fade_start)
-        if processed_coords_list:
-            try:
-                # Calculate the fade start frame by multiplying percentage by total frames
-                fade_start_frame = int(animated_fade_start * total_frames) if animated_fade_start > 0 else 0
-                
-                for path_idx, path_coords in enumerate(processed_coords_list):
-                    # Check layer visibility toggle
-                    if coord_visibility_list and path_idx < len(coord_visibility_list) and not coord_visibility_list[path_idx]:
-                        continue
+        for path_idx, path_coords in enumerate(processed_coords_list):
+            # Check layer visibility toggle; empty layers have no track, as they draw nothing
+            if not coord_visibility_list[path_idx] or not path_coords:
+                continue
 
-                    path_start_p, path_end_p = path_pause_frames[path_idx]
-                    single_path_coords = []
+            try:
+                path_start_p, path_end_p = path_pause_frames[path_idx]
+                num_coords = len(path_coords)
+                path_x = np.fromiter((float(pt["x"]) for pt in path_coords), dtype=np.float64, count=num_coords)
+                path_y = np.fromiter((float(pt["y"]) for pt in path_coords), dtype=np.float64, count=num_coords)
 
-                    # Base position for this path: first key as P0
-                    base_coord0 = path_coords[0] if path_coords else {"x": 0.0, "y": 0.0}
-                    P0x = float(base_coord0.get("x", 0.0))
-                    P0y = float(base_coord0.get("y", 0.0))
-                    # Precompute driven-layer bounding center to use as rotation pivot
-                    try:
-                        min_px = min(float(pt.get("x", 0.0)) for pt in path_coords)
-                        max_px = max(float(pt.get("x", 0.0)) for pt in path_coords)
-                        min_py = min(float(pt.get("y", 0.0)) for pt in path_coords)
-                        max_py = max(float(pt.get("y", 0.0)) for pt in path_coords)
-                        Pcx = (min_px + max_px) * 0.5
-                        Pcy = (min_py + max_py) * 0.5
-                    except Exception:
-                        Pcx = P0x
-                        Pcy = P0y
-
-                    # Box driver path + scale profile, if this layer is driven by a box
-                    box_path = None
-                    box_scale_profile = None
-                    B0x = B0y = 0.0
-                    S0 = 1.0
-                    R0 = 0.0
-                    if coords_driver_info_list and path_idx < len(coords_driver_info_list):
-                        base_driver_info = coords_driver_info_list[path_idx]
-                        if isinstance(base_driver_info, dict) and base_driver_info.get("driver_type") == "box":
-                            box_path = base_driver_info.get("interpolated_path") or base_driver_info.get("path")
-                            box_scale_profile = base_driver_info.get("driver_scale_profile")
-                            if box_path:
-                                try:
-                                    B0x = float(box_path[0].get("x", 0.0))
-                                    B0y = float(box_path[0].get("y", 0.0))
-                                except (TypeError, ValueError):
-                                    B0x = B0y = 0.0
-                                try:
-                                    R0 = float(box_path[0].get("boxR", 0.0) or 0.0)
-                                except (TypeError, ValueError):
-                                    R0 = 0.0
-                            if isinstance(box_scale_profile, list) and box_scale_profile:
-                                try:
-                                    S0 = float(box_scale_profile[0]) or 1.0
-                                except (TypeError, ValueError):
-                                    S0 = 1.0
-                    for i in range(total_frames):
-                        if i < path_start_p:
-                            coord_index = 0
-                        elif i >= total_frames - path_end_p:
-                            coord_index = len(path_coords) - 1
-                        else:
-                            coord_index = i - path_start_p
-                        coord_index = max(0, min(coord_index, len(path_coords) - 1))
-                        
-                        # Extract x, y and apply driver offset if present
-                        coord = path_coords[coord_index]
-                        driver_offset_x = driver_offset_y = 0.0
-                        interpolated_driver = None
-                        d_scale = DRIVER_SCALE_FACTOR
-                        driver_info = None
-                        driver_type = None
-                        is_box_driver = False
-                        eff_frame = 0
-                        if coords_driver_info_list and path_idx < len(coords_driver_info_list):
-                            driver_info = coords_driver_info_list[path_idx]
-                            driver_type = driver_info.get('driver_type') if driver_info else None
-                            is_box_driver = driver_type == 'box'
-                            if driver_info and not driver_info.get('is_points_mode', False):
-                                interpolated_driver = driver_info.get('interpolated_path')
-                                d_scale = driver_info.get('d_scale', 1.0)
-
-                        if interpolated_driver and len(interpolated_driver) > 0:
-                            driver_start_p = int(driver_info.get('start_pause', 0))
-                            driver_offset_val = int(driver_info.get('offset', 0))
-                            pos_delay = driver_start_p + max(0, driver_offset_val)
-                            neg_lead = -min(0, driver_offset_val)
-                            eff_frame = max(0, i - pos_delay + neg_lead)
-
-                            if not is_box_driver:
-                                # Original behavior for non-box drivers: offset relative to driver's first point
-                                driver_offset_x, driver_offset_y = calculate_driver_offset(
-                                    eff_frame, interpolated_driver, (0, 0),
-                                    total_frames, d_scale, frame_width, frame_height,
-                                    driver_scale_factor=driver_info.get('driver_scale_factor', 1.0),
-                                    driver_radius_delta=driver_info.get('driver_radius_delta', 0.0),
-                                    driver_path_normalized=False,
-                                    apply_scale_to_offset=True
-                                )
-                            else:
-                                # Box drivers for animated paths: compute pure relative
-                                # offset and relative scale around the path's own base
-                                # position so points never snap to the box origin.
-                                # We ignore calculate_driver_offset for this case and use
-                                # the raw box path instead.
-                                if box_path:
-                                    box_idx = max(0, min(eff_frame, len(box_path) - 1))
-                                    box_pt = box_path[box_idx]
-                                    try:
-                                        Bfx = float(box_pt.get("x", 0.0))
-                                        Bfy = float(box_pt.get("y", 0.0))
-                                    except (TypeError, ValueError):
-                                        Bfx = B0x
-                                        Bfy = B0y
-                                    try:
-                                        Rf = float(box_pt.get("boxR", 0.0) or 0.0)
-                                    except (TypeError, ValueError):
-                                        Rf = R0
-
-                                    # Relative box offset from frame 0
-                                    deltaBx = Bfx - B0x
-                                    deltaBy = Bfy - B0y
-
-                                    # Relative scale from frame 0
-                                    if isinstance(box_scale_profile, list) and box_scale_profile and box_idx < len(box_scale_profile):
-                                        try:
-                                            Sf = float(box_scale_profile[box_idx])
-                                        except (TypeError, ValueError):
-                                            Sf = S0
-                                    else:
-                                        Sf = S0
-                                    scale_rel = Sf / S0 if S0 != 0 else 1.0
-                                    try:
-                                        rot_f = float(box_pt.get("boxR", 0.0) or 0.0)
-                                    except (TypeError, ValueError):
-                                        rot_f = R0
-
-                                    # Apply relative scale around P0, then add box offset
-                                    raw_x = float(coord["x"])
-                                    raw_y = float(coord["y"])
-                                    location_x = P0x + (raw_x - P0x) * scale_rel + deltaBx
-                                    location_y = P0y + (raw_y - P0y) * scale_rel + deltaBy
-
-                                    # Apply relative rotation around driven-layer bounding center transformed with same scale/offset
-                                    pivot_x = P0x + (Pcx - P0x) * scale_rel + deltaBx
-                                    pivot_y = P0y + (Pcy - P0y) * scale_rel + deltaBy
-                                    deltaRot = rot_f - R0
-                                    if abs(deltaRot) > 1e-4:
-                                        cos_r = math.cos(deltaRot)
-                                        sin_r = math.sin(deltaRot)
-                                        rel_x = location_x - pivot_x
-                                        rel_y = location_y - pivot_y
-                                        location_x = pivot_x + rel_x * cos_r - rel_y * sin_r
-                                        location_y = pivot_y + rel_x * sin_r + rel_y * cos_r
-                                else:
-                                    # Fallback: no box path, just use raw coord
-                                    location_x = float(coord["x"])
-                                    location_y = float(coord["y"])
-
-                        # Non-box drivers or no driver: apply offset or use raw coord
-                        if not is_box_driver:
-                            location_x = float(coord["x"]) + driver_offset_x
-                            location_y = float(coord["y"]) + driver_offset_y
+                # Hold the first key through the start pause and the last key through the end pause
+                coord_index = np.where(frame_indices < path_start_p, 0,
+                                       np.where(frame_indices >= total_frames - path_end_p, num_coords - 1,
+                                                frame_indices - path_start_p))
+                np.clip(coord_index, 0, num_coords - 1, out=coord_index)
+                path_xy = np.column_stack((path_x[coord_index], path_y[coord_index]))
 
-                        # Determine visibility based on animated_fade_start
-                        if animated_fade_start == 0 or i < fade_start_frame:
-                            visibility = 1  # Visible
-                        else:
-                            visibility = 0  # Invisible after fade_start_frame
-                        
-                        single_path_coords.append({
-                            "x": int(location_x),
-                            "y": int(location_y),
-                            "v": visibility
-                        })
-                    
-                    # Convert to the format expected by ATI: [x, y, visibility]
-                    # This will be further processed by the ATI node like WanVideoATITracksVisualize
-                    all_coords.append(single_path_coords)
-            except Exception:
-                pass
+                driver_info = coords_driver_info_list[path_idx]
+                interpolated_driver = None
+                if driver_info and not driver_info.get('is_points_mode', False):
+                    interpolated_driver = driver_info.get('interpolated_path')
+                path_view = path_driver_views[path_idx]
+                if path_view is not None and path_view.is_points_mode:
+                    # Driven points layers move exactly as they are drawn on the frames
+                    path_xy = self._points_layer_positions(path_xy, points_mode_arrays[path_idx], path_view,
+                                                           frame_indices)
+                elif interpolated_driver:
+                    driver_offset_val = int(driver_info.get('offset', 0))
+                    pos_delay = int(driver_info.get('start_pause', 0)) + max(0, driver_offset_val)
+                    neg_lead = -min(0, driver_offset_val)
+                    eff_frames = np.maximum(0, frame_indices - pos_delay + neg_lead)
+                    if driver_info.get('driver_type') != 'box':
+                        # Offset relative to the driver's first point
+                        path_xy += calculate_driver_offsets(
+                            eff_frames, interpolated_driver,
+                            driver_info.get('d_scale', 1.0), frame_width, frame_height,
+                            driver_scale_factor=driver_info.get('driver_scale_factor', 1.0),
+                            driver_radius_delta=driver_info.get('driver_radius_delta', 0.0),
+                            driver_path_normalized=False,
+                            apply_scale_to_offset=True
+                        )
+                    else:
+                        # Box drivers move the path relative to its own base position
+                        # so points never snap to the box origin.
+                        path_xy = self._box_driven_positions(
+                            path_xy, path_x, path_y, eff_frames,
+                            interpolated_driver, driver_info.get('driver_scale_profile'))
+
+                # Convert to the format expected by ATI: [x, y, visibility]
+                # This will be further processed by the ATI node like WanVideoATITracksVisualize
+                all_coords.append(self._make_track(path_xy, animated_visibility))
+            except Exception as exc:
+                # One bad layer only loses its own track
+                log.warning("Skipping ATI track for animated layer %s: %s", path_idx, exc)
         
         # Add driver preview tracks for box drivers so preview can draw their curve
         if coords_driver_info_list:
@@ -1522,26 +1868,14 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                 interpolated_driver = driver_info.get('interpolated_path')
                 if not interpolated_driver:
                     continue
-                driver_track = []
-                normalized = driver_info.get('driver_path_normalized', True)
-                for i in range(total_frames):
-                    idx = min(i, len(interpolated_driver) - 1)
-                    pt = interpolated_driver[idx]
-                    try:
-                        x = float(pt.get('x', 0.0))
-                        y = float(pt.get('y', 0.0))
-                    except (TypeError, ValueError):
-                        continue
-                    if normalized:
-                        x *= frame_width
-                        y *= frame_height
-                    driver_track.append({
-                        "x": int(x),
-                        "y": int(y),
-                        "v": 1
-                    })
-                if driver_track:
-                    all_coords.append(driver_track)
+                # Hold the last key past the driver's end and drop frames whose key didn't parse
+                driver_xy, valid = _path_xy(interpolated_driver)
+                if driver_info.get('driver_path_normalized', True):
+                    driver_xy *= (frame_width, frame_height)
+                driver_idx = np.minimum(frame_indices, len(driver_xy) - 1)
+                driver_xy = driver_xy[driver_idx[valid[driver_idx]]]
+                if len(driver_xy):
+                    all_coords.append(self._make_track(driver_xy, 1))
 
         # Process static points (p_coordinates) - affected by static_fade_start
         if static_point_layers:
@@ -1564,54 +1898,16 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                         first_preview_static_driver = entry
                         break
             try:
-                # Calculate the fade start frame by multiplying percentage by total frames
-                fade_start_frame = int(static_fade_start * total_frames) if static_fade_start > 0 else 0
-
-                # Normalize per-layer pause frames for static points for preview generation (use 'p')
-                prev_p_start = meta.get("start_p_frames", 0)
-                prev_p_end = meta.get("end_p_frames", 0)
-                def prev_to_list(val):
-                    if isinstance(val, dict):
-                        v = val.get("p", 0)
-                    else:
-                        v = val
-                    if isinstance(v, list):
-                        out = v
-                    else:
-                        out = [v] * (len(static_point_layers) if static_point_layers else 1)
-                    return out
-                prev_start_list_raw = prev_to_list(prev_p_start)
-                prev_end_list_raw = prev_to_list(prev_p_end)
-                # ensure lengths and ints
-                L = len(static_point_layers) if static_point_layers else 0
-                def clean_len_int(lst):
-                    if L == 0:
-                        return []
-                    out = (lst or [])[:L] + [0] * max(0, L - len(lst or []))
-                    cleaned = []
-                    for x in out:
-                        try:
-                            cleaned.append(int(x))
-                        except (ValueError, TypeError):
-                            cleaned.append(0)
-                    return cleaned
-                prev_start_list = clean_len_int(prev_start_list_raw)
-                prev_end_list = clean_len_int(prev_end_list_raw)
-
                 # Process each layer of static points
                 for layer_idx, static_points in enumerate(static_point_layers):
-                    if not static_points:
+                    # Skip empty layers and layers toggled off
+                    if not static_points or not static_points_visibility_list[layer_idx]:
                         continue
 
                     # Get this layer's specific timing
-                    layer_start_pause = p_start_list[layer_idx] if layer_idx < len(p_start_list) else 0
-                    layer_end_pause = p_end_list[layer_idx] if layer_idx < len(p_end_list) else 0
-                    layer_offset = p_offsets_list[layer_idx] if layer_idx < len(p_offsets_list) else 0
-
-                    # Check layer visibility toggle
-                    layer_is_visible = static_points_visibility_list[layer_idx] if static_points_visibility_list and layer_idx < len(static_points_visibility_list) else True
-                    if not layer_is_visible:
-                        continue # Skip this layer if toggled off
+                    layer_start_pause = p_start_list[layer_idx]
+                    layer_end_pause = p_end_list[layer_idx]
+                    layer_offset = p_offsets_list[layer_idx]
 
                     # Get the driver for this layer if available
                     layer_driver_info = None
@@ -1621,249 +1917,177 @@ Locations are center locations. Allows coordinates outside the frame for 'fly-in
                         if layer_driver_info is None and not aligned_preview_static_drivers:
                             layer_driver_info = first_preview_static_driver
 
-                    # Process all points in this layer frame-by-frame
-                    # We need to process per-frame so we can rotate all points together around their bbox
-                    layer_splines = [[] for _ in static_points]  # One spline per point
+                    # Point positions and scale factors were already parsed once for the frame
+                    # renderer; reuse them so tracks cover exactly the points that get drawn.
+                    base_xy, point_scales, box_scale_factors = static_layer_arrays[layer_idx]
+                    if not len(base_xy):
+                        continue
 
-                    for i in range(total_frames):
-                        # Calculate the adjusted frame index for the driver based on the points layer's timing
-                        driver_eval_frame = i
-                        if driver_eval_frame < layer_start_pause:
-                            driver_eval_frame = layer_start_pause
+                    # Resolve the driver once per layer; every frame is then transformed at once.
+                    interpolated_driver = None
+                    is_box_driver = False
+                    driver_scale_profile = None
+                    box_pivot = None
+                    box_scale_ratios = None
+                    if layer_driver_info and isinstance(layer_driver_info, dict):
+                        interpolated_driver = _resolve_preview_driver_path(layer_driver_info, 'path')
+                        is_box_driver = layer_driver_info.get('driver_type') == 'box'
+                        driver_pivot = layer_driver_info.get('driver_pivot')
+                        driver_scale_profile = layer_driver_info.get('driver_scale_profile')
+                        # Independent scale-out around the box pivot when driven by a box
+                        if is_box_driver and driver_pivot is not None and driver_scale_profile:
+                            box_pivot = np.array(driver_pivot, dtype=np.float64)
+                            if layer_driver_info.get('driver_path_normalized', True):
+                                box_pivot *= (frame_width, frame_height)
+                            box_scale_ratios = self._box_scale_ratio_table(driver_scale_profile)
+
+                    # Driver frame, offset and rotation for every frame of the layer at once.
+                    # Without a driver path every frame matches the first, so only that one is computed.
+                    num_eval_frames = total_frames if interpolated_driver else min(total_frames, 1)
+                    eff_frames = np.zeros(num_eval_frames, dtype=np.int64)
+                    driver_offsets = np.zeros((num_eval_frames, 2), dtype=np.float64)
+                    rotations = np.zeros(num_eval_frames, dtype=np.float64)
+                    if interpolated_driver:
+                        # Hold the driver through the layer's start/end pauses, then apply the layer offset
+                        driver_eval_frames = np.maximum(frame_indices, layer_start_pause)
                         if total_frames - layer_end_pause > layer_start_pause:
-                            if driver_eval_frame >= total_frames - layer_end_pause:
-                                driver_eval_frame = total_frames - layer_end_pause - 1
-
-                        driver_eval_frame = driver_eval_frame - layer_start_pause - layer_offset
-
-                        driver_offset_x = driver_offset_y = 0.0
-                        eff_static_frame = 0
-                        driver_scale_profile = None
-                        driver_pivot = None
-                        rotation_rad = 0.0
-
-                        is_box_driver = False
-                        if layer_driver_info and isinstance(layer_driver_info, dict):
-                            interpolated_driver = _resolve_preview_driver_path(layer_driver_info, 'path')
-                            driver_d_scale = layer_driver_info.get('d_scale', 1.0)
-                            is_box_driver = layer_driver_info.get('driver_type') == 'box'
-                            driver_pivot = layer_driver_info.get('driver_pivot')
-                            driver_scale_profile = layer_driver_info.get('driver_scale_profile')
-
-                            if interpolated_driver and len(interpolated_driver) > 0:
-                                driver_start_p = int(layer_driver_info.get('start_pause', 0))
-                                driver_offset_val = int(layer_driver_info.get('offset', 0))
-                                pos_delay = driver_start_p + max(0, driver_offset_val)
-                                neg_lead = -min(0, driver_offset_val)
-                                eff_static_frame = max(0, driver_eval_frame - pos_delay + neg_lead)
-
-                                if not is_box_driver:
-                                    # Original behavior for non-box drivers: offset is relative to driver's first point
-                                    driver_offset_x, driver_offset_y = calculate_driver_offset(
-                                        eff_static_frame, interpolated_driver, (0, 0),
-                                        total_frames, driver_d_scale, frame_width, frame_height,
-                                        driver_scale_factor=layer_driver_info.get('driver_scale_factor', 1.0),
-                                        driver_radius_delta=layer_driver_info.get('driver_radius_delta', 0.0),
-                                        driver_path_normalized=layer_driver_info.get('driver_path_normalized', True),
-                                        apply_scale_to_offset=True
-                                    )
-                                else:
-                                    # Box drivers: pure translational offset, independent of scale/radius.
-                                    driver_offset_x, driver_offset_y = calculate_driver_offset(
-                                        eff_static_frame, interpolated_driver, (0, 0),
-                                        total_frames, 1.0, frame_width, frame_height,
-                                        driver_scale_factor=1.0,
-                                        driver_radius_delta=0.0,
-                                        driver_path_normalized=layer_driver_info.get('driver_path_normalized', True),
-                                        apply_scale_to_offset=False
-                                    )
-                                    # Extract rotation for this frame
-                                    try:
-                                        base_rot = float(interpolated_driver[0].get("boxR", 0.0) or 0.0)
-                                        cur_rot = float(interpolated_driver[min(eff_static_frame, len(interpolated_driver) - 1)].get("boxR", 0.0) or 0.0)
-                                        rotation_rad = cur_rot - base_rot
-                                    except (TypeError, ValueError):
-                                        rotation_rad = 0.0
-
-                        # First pass: calculate all transformed positions for this frame
-                        frame_transformed_positions = []
-                        for point in static_points:
-                            # Base point position
-                            base_x = float(point["x"])
-                            base_y = float(point["y"])
-
-                            # Per-point scaling factors
-                            try:
-                                point_scale = float(point.get("pointScale", point.get("scale", 1.0)))
-                            except (TypeError, ValueError):
-                                point_scale = 1.0
-                            try:
-                                box_scale_factor = float(point.get("boxScale", 1.0))
-                            except (TypeError, ValueError):
-                                box_scale_factor = 1.0
-
-                            # Default: no positional scaling, just translation
-                            scaled_x = base_x
-                            scaled_y = base_y
-
-                            # Apply independent scale-out when driven by a box
-                            if is_box_driver and driver_pivot is not None and driver_scale_profile:
-                                pivot_x, pivot_y = driver_pivot
-                                pivot_normalized = layer_driver_info.get('driver_path_normalized', True)
-                                if pivot_normalized:
-                                    pivot_x *= frame_width
-                                    pivot_y *= frame_height
-
-                                boxScale0 = 1.0
-                                try:
-                                    if len(driver_scale_profile) > 0:
-                                        boxScale0 = float(driver_scale_profile[0]) or 1.0
-                                except (TypeError, ValueError):
-                                    boxScale0 = 1.0
-
-                                try:
-                                    if eff_static_frame < len(driver_scale_profile):
-                                        boxScale_f = float(driver_scale_profile[eff_static_frame])
-                                    else:
-                                        boxScale_f = float(driver_scale_profile[-1])
-                                except (TypeError, ValueError):
-                                    boxScale_f = boxScale0
-
-                                if boxScale0 != 0.0:
-                                    R_box = boxScale_f / boxScale0
-                                else:
-                                    R_box = 1.0
-
-                                R_point = 1.0 + (R_box - 1.0) * point_scale * box_scale_factor
-
-                                dx0 = base_x - pivot_x
-                                dy0 = base_y - pivot_y
-                                scaled_x = pivot_x + dx0 * R_point
-                                scaled_y = pivot_y + dy0 * R_point
-
-                            location_x = scaled_x + driver_offset_x
-                            location_y = scaled_y + driver_offset_y
-                            frame_transformed_positions.append((location_x, location_y))
+                            np.minimum(driver_eval_frames, total_frames - layer_end_pause - 1, out=driver_eval_frames)
+                        driver_eval_frames -= layer_start_pause + layer_offset
 
-                        # Second pass: rotate all positions around their collective bounding box
-                        frame_rotated_positions = self._rotate_positions_around_bbox(frame_transformed_positions, rotation_rad)
+                        driver_offset_val = int(layer_driver_info.get('offset', 0))
+                        pos_delay = int(layer_driver_info.get('start_pause', 0)) + max(0, driver_offset_val)
+                        neg_lead = -min(0, driver_offset_val)
+                        eff_frames = np.maximum(0, driver_eval_frames - pos_delay + neg_lead)
 
-                        # Third pass: assign rotated positions to each point's spline
-                        for point_idx, (location_x, location_y) in enumerate(frame_rotated_positions):
-                            if static_fade_start == 0 or i < fade_start_frame:
-                                visibility = 1
-                            else:
-                                visibility = 0
+                        if not is_box_driver:
+                            # Original behavior for non-box drivers: offset is relative to driver's first point
+                            driver_offsets = calculate_driver_offsets(
+                                eff_frames, interpolated_driver,
+                                layer_driver_info.get('d_scale', 1.0), frame_width, frame_height,
+                                driver_scale_factor=layer_driver_info.get('driver_scale_factor', 1.0),
+                                driver_radius_delta=layer_driver_info.get('driver_radius_delta', 0.0),
+                                driver_path_normalized=layer_driver_info.get('driver_path_normalized', True),
+                                apply_scale_to_offset=True
+                            )
+                        else:
+                            # Box drivers: pure translational offset, independent of scale/radius.
+                            driver_offsets = calculate_driver_offsets(
+                                eff_frames, interpolated_driver,
+                                1.0, frame_width, frame_height,
+                                driver_scale_factor=1.0,
+                                driver_radius_delta=0.0,
+                                driver_path_normalized=layer_driver_info.get('driver_path_normalized', True),
+                                apply_scale_to_offset=False
+                            )
+                            box_rotations = np.asarray(self._box_rotation_table(interpolated_driver), dtype=np.float64)
+                            rotations = box_rotations[np.minimum(eff_frames, len(box_rotations) - 1)]
 
-                            layer_splines[point_idx].append({
-                                "x": int(location_x),
-                                "y": int(location_y),
-                                "v": visibility
-                            })
+                    # Default: no positional scaling, just translation
+                    layer_xy = np.broadcast_to(base_xy, (num_eval_frames,) + base_xy.shape)  # One spline per point
+                    if box_pivot is not None:
+                        box_ratios = box_scale_ratios[np.minimum(eff_frames, len(box_scale_ratios) - 1)]
+                        point_ratios = 1.0 + (box_ratios[:, None] - 1.0) * point_scales * box_scale_factors
+                        layer_xy = box_pivot + (base_xy - box_pivot) * point_ratios[..., None]
+                    layer_xy = layer_xy + driver_offsets[:, None]
+
+                    # Rotate each frame's points together around their bounding box center
+                    rotated = np.abs(rotations) >= 1e-4
+                    if rotated.any():
+                        rotated_xy = layer_xy[rotated]
+                        centers = (rotated_xy.min(axis=1) + rotated_xy.max(axis=1))[:, None] * 0.5
+                        cos_r = np.cos(rotations[rotated])[:, None]
+                        sin_r = np.sin(rotations[rotated])[:, None]
+                        rel_x = rotated_xy[..., 0] - centers[..., 0]
+                        rel_y = rotated_xy[..., 1] - centers[..., 1]
+                        layer_xy[rotated] = np.stack((centers[..., 0] + rel_x * cos_r - rel_y * sin_r,
+                                                      centers[..., 1] + rel_x * sin_r + rel_y * cos_r), axis=-1)
+                    if not interpolated_driver:
+                        layer_xy = np.broadcast_to(layer_xy[:1], (total_frames,) + base_xy.shape)
 
                     # Append all point splines from this layer to all_coords
-                    for single_point_spline in layer_splines:
-                        all_coords.append(single_point_spline)
-            except Exception as e:
-                print(f"Error processing static points: {e}")
-                pass
+                    for point_idx in range(len(base_xy)):
+                        all_coords.append(self._make_track(layer_xy[:, point_idx], static_visibility))
+            except Exception:
+                log.exception("Error processing static points")
         
         # Ensure we have at least one track to avoid the ATI error
         if not all_coords:
             # Create a default track at origin if no coordinates exist
-            default_track = []
-            for i in range(total_frames):
-                default_track.append({
-                    "x": 0,
-                    "y": 0,
-                    "v": 1
-                })
-            all_coords.append(default_track)
+            all_coords.append(self._make_track(np.zeros((total_frames, 2), dtype=np.float64), 1))
 
         # Format output as a JSON string that ATI nodes can parse
         # Follow the same format as WanVideoATITracksVisualize
+        # The tracks will be padded to 121 frames and subsampled to 81 frames by the ATI node.
+        # Tracks are int (N, 3) arrays formatted straight to JSON, so no per-point dicts
+        # are ever built and the output needs no validation re-parse.
         try:
-            # Convert tracks to the format that matches what WanVideoATITracksVisualize expects
-            # The tracks will be padded to 121 frames and subsampled to 81 frames by the ATI node
-            clean_tracks = []
-            for track in all_coords:
-                clean_track = []
-                for point in track:
-                    # Include visibility if it exists, default to 1 if not
-                    v = int(point.get("v", 1))
-                    clean_track.append({
-                        "x": int(point["x"]),
-                        "y": int(point["y"]),
-                        "v": v
-                    })
-                clean_tracks.append(clean_track)
-            
             # Format output according to the number of tracks:
             # - If there's only one track, output it as a single list: [{...}, {...}]
             # - If there are multiple tracks, output as a list of lists: [[{...}], [{...}]]
-            if len(clean_tracks) == 1:
-                output_coords_json = json.dumps(clean_tracks[0])
+            if len(all_coords) == 1:
+                output_coords_json = _track_to_json(all_coords[0])
             else:
-                output_coords_json = json.dumps(clean_tracks)
-            
-            # Verify the JSON can be parsed correctly
-            test_parse = json.loads(output_coords_json)
+                output_coords_json = "[" + ",".join(_track_to_json(track) for track in all_coords) + "]"
         except Exception as e:
             # Fallback to empty array if there's an issue
             output_coords_json = "[]"
 
         # ----- Create preview output: bg_image duplicated with splines under shapes -----
         if preview_enabled:
-            # First, duplicate and scale the background
+            # Assemble the preview on the GPU in fp16 for larger batches: the resize and
+            # blend are memory-bound, so halving the bytes moved is the main win.
+            # Small batches stay on the input device to skip the transfer overhead.
+            use_gpu_preview = torch.cuda.is_available() and batch_size >= PREVIEW_GPU_MIN_FRAMES
+
+            # First, scale the single background frame to 50% size, then duplicate it.
+            # Downscaling before duplicating avoids a full-resolution [B, H, W, C] copy,
+            # and expand() shares one frame's storage across the batch.
             bg_frame = bg_image[0]  # Shape: [H, W, C]
-            bg_frames_duplicated = bg_frame.unsqueeze(0).repeat(batch_size, 1, 1, 1)  # [B, H, W, C]
-
-            # Scale background to 50% size
-            bg_frames_duplicated = bg_frames_duplicated.permute(0, 3, 1, 2)  # BHWC -> BCHW
-            scaled_height = bg_frames_duplicated.shape[2] // 2
-            scaled_width = bg_frames_duplicated.shape[3] // 2
-            bg_frames_duplicated = torch.nn.functional.interpolate(
-                bg_frames_duplicated,
-                size=(scaled_height, scaled_width),
-                mode='bilinear',
-                align_corners=False
-            )
-            bg_frames_duplicated = bg_frames_duplicated.permute(0, 2, 3, 1)  # BCHW -> BHWC
+            if use_gpu_preview:
+                bg_frame = bg_frame.to('cuda', dtype=torch.float16, non_blocking=True)
+            bg_frame = bg_frame.permute(2, 0, 1).unsqueeze(0)  # HWC -> [1, C, H, W]
+            bg_frame = self._downscale_half(bg_frame)
+            bg_frame = bg_frame.permute(0, 2, 3, 1)  # [1, C, h, w] -> [1, h, w, C]
+            bg_frames_duplicated = bg_frame.expand(batch_size, -1, -1, -1)  # [B, h, w, C] view
 
             # Draw orange splines using ATI tracks (now available after building them)
             preview_with_splines = self._draw_splines_on_preview(
                 bg_frames_duplicated, processed_coords_list, path_pause_frames,
                 total_frames, coords_driver_info_list, static_point_layers,
                 static_points_use_driver, static_points_driver_path_processed,
-                meta.get("start_p_frames", 0), meta.get("end_p_frames", 0),
+                start_p_frames_meta, end_p_frames_meta,
                 static_points_driver_info_list, static_points_interpolated_drivers,
                 frame_width, frame_height, coord_visibility_list
             )
 
-            # Now composite the drawn shapes at 50% opacity on top of bg+splines
-            preview_frames = []
-            for i in range(batch_size):
-                # Scale the drawn frame to 50%
-                drawn_frame = out_images[i].unsqueeze(0)  # [1, H, W, C]
-                drawn_frame = drawn_frame.permute(0, 3, 1, 2)  # -> [1, C, H, W]
-                drawn_frame = torch.nn.functional.interpolate(
-                    drawn_frame,
-                    size=(scaled_height, scaled_width),
-                    mode='bilinear',
-                    align_corners=False
-                )
-                drawn_frame = drawn_frame.permute(0, 2, 3, 1).squeeze(0)  # -> [H, W, C]
-
-                # Convert to same device/dtype as preview_with_splines
-                drawn_frame = drawn_frame.to(device=preview_with_splines.device, dtype=preview_with_splines.dtype)
-
-                # Normal alpha blending: (bg+splines) * (1 - alpha) + drawn * alpha, where alpha = 0.5
-                preview_frame = preview_with_splines[i] * ALPHA_BLEND_FACTOR + drawn_frame * ALPHA_BLEND_FACTOR
-                preview_frame = torch.clamp(preview_frame, 0.0, 1.0)
-                preview_frames.append(preview_frame.unsqueeze(0))
-
-            # Stack all preview frames into a batch
-            preview_output = torch.cat(preview_frames, dim=0)
+            # Now composite the drawn shapes at 50% opacity on top of bg+splines.
+            # Scale the whole drawn batch to 50% in one call rather than frame by frame.
+            drawn_frames = out_images
+            if use_gpu_preview:
+                drawn_frames = drawn_frames.to('cuda', dtype=torch.float16, non_blocking=True)
+            drawn_frames = drawn_frames.permute(0, 3, 1, 2)  # BHWC -> BCHW
+            drawn_frames = self._downscale_half(drawn_frames)
+            drawn_frames = drawn_frames.permute(0, 2, 3, 1)  # BCHW -> BHWC
+
+            # Convert to same device/dtype as preview_with_splines
+            drawn_frames = drawn_frames.to(device=preview_with_splines.device, dtype=preview_with_splines.dtype)
+
+            # Normal alpha blending: (bg+splines) * (1 - alpha) + drawn * alpha, where alpha = 0.5.
+            # lerp does the weighted sum in a single pass, written over the downscaled drawn frames
+            # (a fresh batch nothing else references) so no extra output batch is allocated.
+            # On the CPU the numba kernel fuses the blend and the clamp into that one pass.
+            if (_blend_frames is not None and drawn_frames.device.type == 'cpu'
+                    and drawn_frames.dtype == torch.float32
+                    and preview_with_splines.shape == drawn_frames.shape):
+                _blend_frames(preview_with_splines.numpy(), drawn_frames.numpy(), ALPHA_BLEND_FACTOR)
+                preview_output = drawn_frames
+            else:
+                preview_output = torch.lerp(preview_with_splines, drawn_frames, ALPHA_BLEND_FACTOR,
+                                            out=drawn_frames).clamp_(0.0, 1.0)
+            if use_gpu_preview:
+                # IMAGE outputs are consumed as fp32 CPU tensors; copy the fp16 batch first so
+                # the device-to-host transfer moves half the bytes, then widen on the CPU
+                preview_output = preview_output.cpu().float()
         else:
             # Return minimal 1x1 pixel preview for efficiency when preview is disabled
             preview_output = torch.zeros([batch_size, 1, 1, 3], dtype=torch.float32)
@@ -9,12 +9,22 @@ side (for previews) and the server-side rendering path.
 
 from __future__ import annotations
 
+import logging
 import math
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
+
 from ..utility import draw_utils
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; calculate_driver_offsets falls back to NumPy
+    njit = None
+
+log = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class LayerDriverRecord:
@@ -90,6 +100,81 @@ def calculate_driver_offset(
     return 0.0, 0.0
 
 
+def _driver_offsets_numpy(
+    driver_xy: np.ndarray,
+    frame_indices: np.ndarray,
+    scale_multiplier: float,
+    driver_radius_delta: float,
+    scale_x: float,
+    scale_y: float,
+) -> np.ndarray:
+    idx = np.clip(frame_indices, 0, driver_xy.shape[0] - 1)
+    offsets = (driver_xy[idx] - driver_xy[0]) * scale_multiplier
+    if driver_radius_delta:
+        length = np.hypot(offsets[:, 0], offsets[:, 1])
+        nonzero = length > 0
+        offsets[nonzero] += offsets[nonzero] / length[nonzero, None] * driver_radius_delta
+    offsets[:, 0] *= scale_x
+    offsets[:, 1] *= scale_y
+    return offsets
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _driver_offsets_kernel(driver_xy, frame_indices, scale_multiplier, driver_radius_delta, scale_x, scale_y):
+        n = driver_xy.shape[0]
+        ref_x = driver_xy[0, 0]
+        ref_y = driver_xy[0, 1]
+        out = np.empty((frame_indices.shape[0], 2), dtype=np.float64)
+        for i in range(frame_indices.shape[0]):
+            j = min(max(frame_indices[i], 0), n - 1)
+            offset_x = (driver_xy[j, 0] - ref_x) * scale_multiplier
+            offset_y = (driver_xy[j, 1] - ref_y) * scale_multiplier
+            if driver_radius_delta != 0.0:
+                length = math.hypot(offset_x, offset_y)
+                if length > 0.0:
+                    offset_x += (offset_x / length) * driver_radius_delta
+                    offset_y += (offset_y / length) * driver_radius_delta
+            out[i, 0] = offset_x * scale_x
+            out[i, 1] = offset_y * scale_y
+        return out
+else:
+    _driver_offsets_kernel = _driver_offsets_numpy
+
+
+def calculate_driver_offsets(
+    frame_indices: Iterable[int],
+    interpolated_driver: List[Dict[str, Any]],
+    driver_scale: float = 1.0,
+    frame_width: int = 512,
+    frame_height: int = 512,
+    driver_scale_factor: float = 1.0,
+    driver_radius_delta: float = 0.0,
+    driver_path_normalized: bool = True,
+    apply_scale_to_offset: bool = True,
+) -> np.ndarray:
+    """
+    Vectorised calculate_driver_offset: evaluate the driver offset for every
+    frame in frame_indices at once. Returns a (len(frame_indices), 2) array.
+    Callers evaluate each driver once per run, so nothing is cached here.
+    """
+    if isinstance(frame_indices, np.ndarray):
+        frame_indices = frame_indices.astype(np.int64, copy=False)
+    else:
+        frame_indices = np.fromiter(frame_indices, dtype=np.int64)
+    if not interpolated_driver:
+        return np.zeros((len(frame_indices), 2), dtype=np.float64)
+
+    driver_xy = np.array([(float(pt["x"]), float(pt["y"])) for pt in interpolated_driver], dtype=np.float64)
+    scale_multiplier = driver_scale * driver_scale_factor if apply_scale_to_offset else driver_scale
+    scale_x = float(frame_width) if driver_path_normalized else 1.0
+    scale_y = float(frame_height) if driver_path_normalized else 1.0
+    return _driver_offsets_kernel(
+        driver_xy, frame_indices, float(scale_multiplier),
+        float(driver_radius_delta or 0.0), scale_x, scale_y,
+    )
+
+
 def apply_box_pivot_scaling(
     loc_x: float,
     loc_y: float,
@@ -351,7 +436,7 @@ def apply_driver_chain_offsets(
             meta, driver_info_list, names_key=names_key, fallback_prefix=fallback_prefix
         )
     except DriverGraphError as exc:
-        print(f"[DriverChain] error: {exc}")
+        log.warning("[DriverChain] error: %s", exc)
         return resolved_paths
 
     for record in driver_records:
@@ -494,6 +579,16 @@ def get_driver_scale_for_frame(driver_info: Dict[str, Any], frame_index: int, de
     return float(driver_info.get("driver_scale_factor", default_scale))
 
 
+def scale_path_points(points: List[Dict[str, Any]], scale_x: float, scale_y: float) -> List[Dict[str, Any]]:
+    """Copy each point dict with x/y multiplied by scale_x/scale_y, scaling the whole path in one NumPy op."""
+    if not points:
+        return []
+    xy = np.fromiter((float(v) for pt in points for v in (pt["x"], pt["y"])),
+                     dtype=np.float64, count=2 * len(points)).reshape(-1, 2)
+    xy *= (scale_x, scale_y)
+    return [{**pt, "x": x, "y": y} for pt, (x, y) in zip(points, xy.tolist())]
+
+
 def scale_points_and_driver_path(
     static_point_layers: List[List[Dict[str, Any]]],
     static_points_driver_path: Optional[List[Dict[str, Any]]],
@@ -511,25 +606,13 @@ def scale_points_and_driver_path(
     if scale_x == 1.0 and scale_y == 1.0:
         return static_point_layers, static_points_driver_path, True
 
-    scaled_static_layers: List[List[Dict[str, Any]]] = []
-    for layer in static_point_layers:
-        scaled_layer: List[Dict[str, Any]] = []
-        for pt in layer:
-            sp = dict(pt)
-            sp["x"] = float(pt["x"]) * scale_x
-            sp["y"] = float(pt["y"]) * scale_y
-            scaled_layer.append(sp)
-        scaled_static_layers.append(scaled_layer)
+    scaled_static_layers = [scale_path_points(layer, scale_x, scale_y) for layer in static_point_layers]
 
     scaled_driver: Optional[List[Dict[str, Any]]] = None
     if static_points_driver_path:
-        scaled_driver = []
-        for pt in static_points_driver_path:
-            if isinstance(pt, dict) and "x" in pt and "y" in pt:
-                sp = dict(pt)
-                sp["x"] = float(pt["x"]) * scale_x
-                sp["y"] = float(pt["y"]) * scale_y
-                scaled_driver.append(sp)
+        scaled_driver = scale_path_points(
+            [pt for pt in static_points_driver_path if isinstance(pt, dict) and "x" in pt and "y" in pt],
+            scale_x, scale_y)
 
     return scaled_static_layers, scaled_driver, False
 
@@ -1107,8 +1190,9 @@ def build_interpolated_paths(
                         "driver_layer_name": driver_target_ref,
                         "layer_name": resolved_layer_names[i],
                     }
-                    print(
-                        f"[DriverDebug] driver_info_for_frame layer={resolved_layer_names[i]} target={driver_info_for_frame['driver_layer_name']} is_points={is_points_mode}"
+                    log.debug(
+                        "[DriverDebug] driver_info_for_frame layer=%s target=%s is_points=%s",
+                        resolved_layer_names[i], driver_info_for_frame["driver_layer_name"], is_points_mode,
                     )
 
             # Apply offset timing (modify processed_path and adjust pauses)
@@ -1143,10 +1227,12 @@ __all__ = [
     "resolve_driver_processing_order",
     "round_coord",
     "calculate_driver_offset",
+    "calculate_driver_offsets",
     "apply_box_pivot_scaling",
     "apply_driver_chain_offsets",
     "build_layer_path_map",
     "get_driver_scale_for_frame",
+    "scale_path_points",
     "scale_points_and_driver_path",
     "process_driver_path",
     "scale_driver_metadata",